@@ -25,6 +25,21 @@ class Settings:
     ngrok_api_base: str = os.environ.get("NGROK_API_BASE", "http://ngrok:4040")
     auto_set_webhook: bool = _bool(os.environ.get("AUTO_SET_WEBHOOK", "true"))
 
+    # Standalone mode (USE_WEBHOOK=false): "polling" uses long polling (works
+    # behind NAT with no public URL); "webhook" opts into PTB's built-in
+    # webhook server, which must be reachable on WEBHOOK_PORT.
+    bot_mode: str = os.environ.get("BOT_MODE", "polling").strip().lower()
+    webhook_listen: str = os.environ.get("WEBHOOK_LISTEN", "0.0.0.0")
+    webhook_port: int = int(os.environ.get("WEBHOOK_PORT", "8443"))
+    webhook_secret: str = os.environ.get("WEBHOOK_SECRET", "")
+
+    # Persistence: when set, user_data and conversation states live in Redis.
+    # Without Redis, a single instance can pickle them to a local file instead.
+    redis_url: str = os.environ.get("REDIS_URL", "")
+    persistence_file: str = os.environ.get("PERSISTENCE_FILE", "")
+    # Seconds between persistence flushes; writes are coalesced in between.
+    persistence_update_interval: float = float(os.environ.get("PERSISTENCE_UPDATE_INTERVAL", "60"))
+
     # Logging
     app_env: str = os.environ.get("APP_ENV", "dev")
     service_name: str = os.environ.get("SERVICE_NAME", "conversation_bot")
@@ -1,50 +1,93 @@
-import requests
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import orjson
 
 from .config import settings
 
 
+class FoursquareAPIError(Exception):
+    """Non-2xx response from the Places API, with the body kept for logging."""
+
+    def __init__(self, status: int, response_text: str):
+        super().__init__(f"Foursquare API returned HTTP {status}")
+        self.status = status
+        self.response_text = response_text
+
+
 class FoursquareClient:
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, timeout_seconds: float = 5, max_concurrency: int = 10):
         self.api_key = api_key or settings.foursquare_api_key
         self.search_base = "https://places-api.foursquare.com/places/search"
-        self.photo_base = "https://places-api.foursquare.com/places/{fsq_id}/photos?limit=5"
+        self.photo_base = "https://places-api.foursquare.com/places/{fsq_id}/photos"
         self.suggest_base = "https://places-api.foursquare.com/places/suggest/place"
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Caps in-flight API calls across all users; with the total timeout a
+        # stalled upstream can hold a slot for at most ``timeout_seconds``.
+        self._slots = asyncio.Semaphore(max_concurrency)
 
-    def search(self, *, ll: str, fields: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        q = {"ll": ll, "fields": fields, **params}
-        headers = {
+    def _headers(self, api_version: str) -> Dict[str, str]:
+        return {
             "accept": "application/json",
-            "X-Places-Api-Version": "2025-02-05",
+            "X-Places-Api-Version": api_version,
             "Authorization": f"Bearer {self.api_key}",
         }
-        resp = requests.get(self.search_base, params=q, headers=headers)
-        resp.raise_for_status()
-        return resp.json()
 
-    def photos(self, fsq_place_id: str) -> List[Dict[str, Any]]:
-        headers = {
-            "accept": "application/json",
-            "X-Places-Api-Version": "2025-06-17",
-            "Authorization": f"Bearer {self.api_key}",
-        }
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Created on first use so it binds to the running event loop; one pooled
+        # session reuses TCP/TLS connections across all users' requests.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=self.timeout,
+            )
+        return self._session
+
+    async def warm_up(self) -> None:
+        """Resolve DNS and complete the TLS handshake so the first search reuses a pooled connection."""
+        async with self._slots, self.session.head(self.search_base, headers={"accept": "application/json"}) as resp:
+            await resp.read()
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request(self, method: str, url: str, *, headers: Dict[str, str], params: Optional[Dict[str, Any]] = None) -> Any:
+        async with self._slots, self.session.request(method, url, params=params, headers=headers) as resp:
+            if resp.status >= 400:
+                raise FoursquareAPIError(resp.status, await resp.text())
+            return orjson.loads(await resp.read())
+
+    async def search(self, *, ll: str, fields: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        q = {"ll": ll, "fields": fields, **params}
+        return await self._request("GET", self.search_base, params=_query_params(q), headers=self._headers("2025-02-05"))
+
+    async def photos(self, fsq_place_id: str, limit: int = 5) -> List[Dict[str, Any]]:
         url = self.photo_base.format(fsq_id=fsq_place_id)
-        resp = requests.get(url, headers=headers)
-        resp.raise_for_status()
-        data = resp.json()
+        data = await self._request("GET", url, params={"limit": str(limit)}, headers=self._headers("2025-06-17"))
         return data if isinstance(data, list) else []
 
-    def suggest_place(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def suggest_place(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calls Foursquare "Suggest a New Place" endpoint.
         Expects query parameters in `params` as per docs. Values should be simple
         scalars or comma-separated strings for list-like fields.
         """
-        headers = {
-            "accept": "application/json",
-            "X-Places-Api-Version": "2025-02-05",
-            "Authorization": f"Bearer {self.api_key}",
-        }
-        resp = requests.post(self.suggest_base, params=params, headers=headers)
-        resp.raise_for_status()
-        return resp.json() 
\ No newline at end of file
+        return await self._request("POST", self.suggest_base, params=_query_params(params), headers=self._headers("2025-02-05"))
+
+
+def _query_params(params: Dict[str, Any]) -> Dict[str, str]:
+    # aiohttp rejects None and bool query values: drop None as requests did and
+    # send bools as the lowercase strings the API expects.
+    out: Dict[str, str] = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        out[key] = str(value)
+    return out
@@ -1,6 +1,11 @@
+import asyncio
 from typing import Any
-import json
-from litellm import completion
+
+import httpx
+import litellm
+import orjson
+from litellm import acompletion
+from pydantic import ValidationError
 
 from .config import settings
 
@@ -19,17 +24,56 @@ class LLMClient:
     See https://docs.litellm.ai/docs/providers for full provider list.
     """
     
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrency: int = 20,
+        timeout_seconds: float = 10.0,
+        max_retries: int = 2,
+    ):
         self.chat_model = settings.llm_chat_model
         self.parse_model = settings.llm_parse_model
         self.api_key = api_key  # Optional override, litellm will use env vars by default
+        # Bounds in-flight completions across all users so a burst of updates
+        # queues here instead of piling up open requests and memory.
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _ensure_http_client(self) -> None:
+        # Created on first use and shared with litellm, which reuses it for
+        # OpenAI-compatible providers: one sized, HTTP/2 pool instead of the
+        # SDK defaults, so concurrent parses multiplex over few connections.
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+                timeout=httpx.Timeout(self.timeout_seconds, connect=3.0),
+            )
+            litellm.aclient_session = self._http_client
+
+    async def close(self) -> None:
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
+        if litellm.aclient_session is self._http_client:
+            litellm.aclient_session = None
+        self._http_client = None
+
+    async def _complete(self, **kwargs: Any) -> Any:
+        kwargs.setdefault("timeout", self.timeout_seconds)
+        kwargs.setdefault("num_retries", self.max_retries)
+        self._ensure_http_client()
+        async with self._slots:
+            return await acompletion(**kwargs)
         
-    def chat(
+    async def chat(
         self, 
         *, 
         model: str | None = None, 
         messages: list[dict], 
-        temperature: float | None = None
+        temperature: float | None = None,
+        max_tokens: int | None = None
     ) -> str:
         """
         Send a chat completion request.
@@ -38,6 +82,7 @@ class LLMClient:
             model: Model name (e.g., 'gpt-4.1-nano', 'claude-4-5-sonnet')
             messages: List of message dicts with 'role' and 'content'
             temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Optional cap on the completion length
             
         Returns:
             The text response from the model
@@ -51,14 +96,17 @@ class LLMClient:
         
         if temperature is not None:
             kwargs["temperature"] = temperature
+
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
             
         if self.api_key:
             kwargs["api_key"] = self.api_key
         
-        response = completion(**kwargs)
+        response = await self._complete(**kwargs)
         return response.choices[0].message.content.strip()
     
-    def parse(
+    async def parse(
         self, 
         *, 
         model: str | None = None, 
@@ -101,19 +149,19 @@ class LLMClient:
             kwargs["api_key"] = self.api_key
         
         try:
-            response = completion(**kwargs)
+            response = await self._complete(**kwargs)
             content = response.choices[0].message.content.strip()
             
             # Parse the JSON response
             try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
+                data = orjson.loads(content)
+            except orjson.JSONDecodeError:
                 # Try to extract JSON from markdown code blocks
                 if content.startswith('```json'):
                     content = content[7:]
                 if content.endswith('```'):
                     content = content[:-3]
-                data = json.loads(content.strip())
+                data = orjson.loads(content.strip())
             
             # Convert to Pydantic model
             if hasattr(response_format, 'model_validate'):
@@ -123,16 +171,18 @@ class LLMClient:
                 # Pydantic v1
                 return response_format.parse_obj(data)
                 
-        except Exception as e:
-            # Fallback: try without strict JSON schema
+        except (orjson.JSONDecodeError, ValidationError, ValueError, litellm.UnsupportedParamsError):
+            # Fallback: try without strict JSON schema. Only for bad output or
+            # an unsupported response_format; timeouts and provider errors
+            # already went through litellm's retries and propagate.
             kwargs.pop("response_format", None)
             
             # Add instruction to return JSON
             last_message = messages[-1]
             if last_message.get('role') == 'user':
-                messages[-1]['content'] = f"{last_message['content']}\n\nPlease respond with valid JSON matching this schema: {json.dumps(schema)}"
+                messages[-1]['content'] = f"{last_message['content']}\n\nPlease respond with valid JSON matching this schema: {orjson.dumps(schema).decode()}"
             
-            response = completion(**kwargs)
+            response = await self._complete(**kwargs)
             content = response.choices[0].message.content.strip()
             
             # Try to parse and validate
@@ -141,7 +191,7 @@ class LLMClient:
                     content = content[7:]
                 if content.endswith('```'):
                     content = content[:-3]
-                data = json.loads(content.strip())
+                data = orjson.loads(content.strip())
                 
                 if hasattr(response_format, 'model_validate'):
                     return response_format.model_validate(data)
@@ -1,22 +1,35 @@
+import atexit
+import copy
 import logging
 import os
+import queue
 import uuid
 import contextvars
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pythonjsonlogger import jsonlogger
 from typing import Any, Dict, Optional
 
+import orjson
+
 from .config import settings
 
 # Correlation id context
 request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
 
 
+def _orjson_dumps(obj: Any, *, default: Any = None, **_: Any) -> str:
+    # python-json-logger passes json.dumps-style kwargs (cls, indent, ...)
+    # that orjson does not support; anything unserializable falls back to str.
+    return orjson.dumps(obj, default=default or str).decode()
+
+
 class EnrichedJsonFormatter(jsonlogger.JsonFormatter):
     def add_fields(self, log_record, record, message_dict):
         super().add_fields(log_record, record, message_dict)
         from datetime import datetime, timezone
-        log_record["timestamp"] = datetime.now(timezone.utc).isoformat()
+        # Formatting happens on the queue listener thread, so stamp the time
+        # the record was created rather than the time it is written.
+        log_record["timestamp"] = datetime.fromtimestamp(record.created, timezone.utc).isoformat()
         log_record["level"] = (getattr(record, "levelname", None) or log_record.get("level", "INFO")).lower()
         log_record.setdefault("service", settings.service_name)
         log_record.setdefault("env", settings.app_env)
@@ -46,18 +59,33 @@ class BaseContextFilter(logging.Filter):
         return True
 
 
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue records for the listener thread without pre-formatting them.
+
+    The stock ``QueueHandler.prepare`` renders the record (traceback included)
+    into ``msg`` and drops ``exc_info``; the JSON formatter needs both intact.
+    Only the ``%``-args are merged here so mutable arguments are captured.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logging() -> logging.Logger:
     logger = logging.getLogger(settings.service_name)
     if logger.handlers:
         return logger
 
     logger.setLevel(getattr(logging, settings.log_level, logging.INFO))
-    formatter = EnrichedJsonFormatter(fmt="%(message)s")
+    formatter = EnrichedJsonFormatter(fmt="%(message)s", json_serializer=_orjson_dumps)
 
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    stream_handler.addFilter(BaseContextFilter())
-    logger.addHandler(stream_handler)
+    handlers: list[logging.Handler] = [stream_handler]
 
     if settings.log_to_file:
         try:
@@ -72,8 +100,19 @@ def setup_logging() -> logging.Logger:
             utc=True,
         )
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(BaseContextFilter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # JSON formatting and stream/file I/O run on the listener thread so the
+    # event loop only pays for enqueueing. The context filter must run on the
+    # caller side, where request_id_var still holds the conversation's id.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(BaseContextFilter())
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
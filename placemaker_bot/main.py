@@ -1,18 +1,24 @@
 import asyncio
 import threading
+from typing import Optional
 
 from telegram import Update
 from telegram.ext import (
     Application,
+    BasePersistence,
     CommandHandler,
     MessageHandler,
     CallbackQueryHandler,
     ConversationHandler,
+    PersistenceInput,
+    PicklePersistence,
     filters,
 )
+from telegram.request import HTTPXRequest
 
 from .config import settings
 from .logging import setup_logging
+from .persistence import RedisPersistence
 from .telegram_handlers import (
     start,
     web_app_data,
@@ -52,7 +58,10 @@ from .telegram_handlers import (
     PRIVATE_PLACE,
     PHOTOS,
     CONFIRM,
+    busy_handler,
     cancel,
+    fsq,
+    llm,
 )
 from .utils import discover_external_base_url
 from .web_server import create_app
@@ -60,6 +69,13 @@ from .web_server import create_app
 
 logger = setup_logging()
 
+# Only message and callback_query updates reach the conversation handler
+# (web app data arrives inside a message), so don't ask Telegram for more.
+ALLOWED_UPDATES: list[str] = [Update.MESSAGE, Update.CALLBACK_QUERY]
+BOT_API_POOL_SIZE = 64
+# Telegram holds getUpdates open up to this long when idle; PTB adds it to the read timeout.
+POLLING_TIMEOUT_SECONDS = 50
+
 
 class ConfigurationError(RuntimeError):
     """Raised when critical configuration is missing."""
@@ -85,64 +101,131 @@ def _validate_required_settings() -> None:
         )
 
 
-def _build_conversation_handler() -> ConversationHandler:
-    skip_cmd = filters.Regex(r"^/skip$")
+def _install_uvloop() -> None:
+    """
+    Use uvloop's libuv-backed event loop when it is available.
+
+    Must run before the first event loop is created, i.e. before the Flask
+    path calls ``asyncio.new_event_loop`` or PTB starts polling/webhooks.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed; using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# Shared filter instances: every text state uses the same combined filter
+# object instead of building its own AndFilter/NotFilter pair.
+TEXT_NO_COMMAND = filters.TEXT & ~filters.COMMAND
+SKIP_COMMAND = filters.Regex(r"^/skip$")
+SKIP_OR_DONE_COMMAND = filters.Regex(r"^/(skip|done)$")
+
+
+async def _warm_http_clients(application: Application) -> None:
+    # Best effort and off the startup path: the unauthenticated HEAD is
+    # rejected, but leaves a kept-alive connection in the pool.
+    async def warm_up() -> None:
+        try:
+            await fsq.warm_up()
+        except Exception:
+            logger.info("Foursquare connection warm-up failed", exc_info=True)
+
+    application.create_task(warm_up())
+
 
+async def _close_http_clients(application: Application) -> None:
+    # Runs after PTB has stopped dispatching updates; the clients are
+    # independent, so close them together and report failures individually.
+    results = await asyncio.gather(fsq.close(), llm.close(), return_exceptions=True)
+    for name, result in zip(("foursquare", "llm"), results):
+        if isinstance(result, Exception):
+            logger.error("Failed to close %s client", name, exc_info=result)
+
+
+def _build_persistence() -> Optional[BasePersistence]:
+    """
+    Redis when REDIS_URL is set, else an optional pickle file.
+
+    Either way state is per-process once loaded (see ``RedisPersistence``).
+    """
+    if settings.redis_url:
+        return RedisPersistence(settings.redis_url, update_interval=settings.persistence_update_interval)
+    if settings.persistence_file:
+        return PicklePersistence(
+            filepath=settings.persistence_file,
+            store_data=PersistenceInput(bot_data=False, chat_data=False, user_data=True, callback_data=False),
+            update_interval=settings.persistence_update_interval,
+        )
+    return None
+
+
+def _build_conversation_handler(persistent: bool = False) -> ConversationHandler:
+    # Handlers that wait on the LLM or Foursquare run with block=False so the
+    # application moves on to other users' updates meanwhile; the conversation
+    # keeps its state pending until the callback returns the next one.
     return ConversationHandler(
+        name="placemaker_conversation",
+        persistent=persistent,
         entry_points=[CommandHandler("start", start)],
         states={
             LOCATION: [
                 MessageHandler(filters.LOCATION, location_handler),
                 MessageHandler(filters.StatusUpdate.WEB_APP_DATA, web_app_data),
             ],
-            LOCATION_CHOICE: [MessageHandler(filters.TEXT & ~filters.COMMAND, location_choice_handler)],
-            QUERY: [MessageHandler(filters.TEXT & ~filters.COMMAND, query_handler)],
-            REFINE: [MessageHandler(filters.TEXT & ~filters.COMMAND, refine_handler)],
-            NAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, name_handler)],
+            LOCATION_CHOICE: [MessageHandler(TEXT_NO_COMMAND, location_choice_handler)],
+            QUERY: [MessageHandler(TEXT_NO_COMMAND, query_handler, block=False)],
+            REFINE: [MessageHandler(TEXT_NO_COMMAND, refine_handler, block=False)],
+            NAME: [MessageHandler(TEXT_NO_COMMAND, name_handler)],
             CATEGORY: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, category_handler),
-                MessageHandler(skip_cmd, category_handler),
+                MessageHandler(TEXT_NO_COMMAND, category_handler, block=False),
+                MessageHandler(SKIP_COMMAND, category_handler, block=False),
             ],
             ADDRESS: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, address_handler),
-                MessageHandler(skip_cmd, address_handler),
+                MessageHandler(TEXT_NO_COMMAND, address_handler, block=False),
+                MessageHandler(SKIP_COMMAND, address_handler, block=False),
             ],
             COORDINATES: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, coordinates_choice_handler),
-                MessageHandler(skip_cmd, coordinates_choice_handler),
+                MessageHandler(TEXT_NO_COMMAND, coordinates_choice_handler),
+                MessageHandler(SKIP_COMMAND, coordinates_choice_handler),
             ],
             COORDINATES_MANUAL: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, coordinates_manual_handler),
-                MessageHandler(skip_cmd, coordinates_manual_handler),
+                MessageHandler(TEXT_NO_COMMAND, coordinates_manual_handler, block=False),
+                MessageHandler(SKIP_COMMAND, coordinates_manual_handler, block=False),
             ],
             CONTACT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, contact_handler),
-                MessageHandler(skip_cmd, contact_handler),
+                MessageHandler(TEXT_NO_COMMAND, contact_handler, block=False),
+                MessageHandler(SKIP_COMMAND, contact_handler, block=False),
             ],
             HOURS: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, hours_handler),
-                MessageHandler(skip_cmd, hours_handler),
+                MessageHandler(TEXT_NO_COMMAND, hours_handler),
+                MessageHandler(SKIP_COMMAND, hours_handler),
             ],
             CUSTOM_HOURS: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, custom_hours_handler),
-                MessageHandler(skip_cmd, custom_hours_handler),
+                MessageHandler(TEXT_NO_COMMAND, custom_hours_handler, block=False),
+                MessageHandler(SKIP_COMMAND, custom_hours_handler, block=False),
             ],
             # CHAIN_STATUS: [CallbackQueryHandler(chain_status_handler)],  # removed
             # CHAIN_DETAILS: [
-            #     MessageHandler(filters.TEXT & ~filters.COMMAND, chain_details_handler),
-            #     MessageHandler(skip_cmd, chain_details_handler),
+            #     MessageHandler(TEXT_NO_COMMAND, chain_details_handler),
+            #     MessageHandler(SKIP_COMMAND, chain_details_handler),
             # ],
-            ATTRIBUTES: [MessageHandler(filters.TEXT & ~filters.COMMAND, attributes_handler)],
+            ATTRIBUTES: [MessageHandler(TEXT_NO_COMMAND, attributes_handler)],
             PRIVATE_PLACE: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, private_place_handler),
-                MessageHandler(skip_cmd, private_place_handler),
+                MessageHandler(TEXT_NO_COMMAND, private_place_handler),
+                MessageHandler(SKIP_COMMAND, private_place_handler),
             ],
             PHOTOS: [
                 MessageHandler(filters.PHOTO, photos_handler),
-                CommandHandler("skip", photos_handler),
-                CommandHandler("done", photos_handler),
+                MessageHandler(SKIP_OR_DONE_COMMAND, photos_handler),
             ],
             CONFIRM: [CallbackQueryHandler(handle_confirmation)],
+            # Used while a block=False handler above is still running.
+            ConversationHandler.WAITING: [
+                CommandHandler("cancel", cancel),
+                MessageHandler(filters.ALL, busy_handler),
+            ],
         },
         fallbacks=[CommandHandler("start", start), CommandHandler("cancel", cancel)],
     )
@@ -152,8 +235,9 @@ def main() -> None:
     """
     Bootstrap the Placemaker Telegram bot.
 
-    Depending on configuration, the bot runs either in webhook mode (Flask +
-    ngrok) or in long-polling mode for local development.
+    Depending on configuration, the bot runs in webhook mode behind Flask +
+    ngrok, in standalone webhook mode using python-telegram-bot's built-in
+    server, or in long-polling mode for local development.
     """
     try:
         _validate_required_settings()
@@ -161,8 +245,24 @@ def main() -> None:
         logger.error("Configuration error: %s", exc)
         raise SystemExit(1) from exc
 
-    application = Application.builder().token(settings.telegram_bot_token).build()
-    application.add_handler(_build_conversation_handler())
+    _install_uvloop()
+
+    # HTTP/2 multiplexes concurrent Bot API calls (replies, chat actions,
+    # background submissions) over one TLS connection; the larger pool covers
+    # bursts when HTTP/2 is unavailable and httpx falls back to HTTP/1.1.
+    builder = (
+        Application.builder()
+        .token(settings.telegram_bot_token)
+        .request(HTTPXRequest(connection_pool_size=BOT_API_POOL_SIZE, http_version="2"))
+        .get_updates_request(HTTPXRequest(http_version="2"))
+        .post_init(_warm_http_clients)
+        .post_shutdown(_close_http_clients)
+    )
+    persistence = _build_persistence()
+    if persistence is not None:
+        builder = builder.persistence(persistence)
+    application = builder.build()
+    application.add_handler(_build_conversation_handler(persistent=persistence is not None))
 
     if settings.use_webhook:
         logger.info("Starting in webhook mode")
@@ -175,19 +275,33 @@ def main() -> None:
 
         event_loop.run_until_complete(application.initialize())
         event_loop.run_until_complete(application.start())
+        # post_init only runs under run_polling/run_webhook; call it explicitly here.
+        event_loop.run_until_complete(_warm_http_clients(application))
 
         if settings.auto_set_webhook:
             external_base = discover_external_base_url()
             if external_base.startswith("https://"):
                 webhook_url = f"{external_base}{settings.webhook_path}"
-                event_loop.run_until_complete(application.bot.set_webhook(url=webhook_url))
-                logger.info(f"Webhook set to: {webhook_url}")
+                event_loop.run_until_complete(
+                    application.bot.set_webhook(
+                        url=webhook_url,
+                        secret_token=settings.webhook_secret or None,
+                        allowed_updates=ALLOWED_UPDATES,
+                    )
+                )
+                logger.info("Webhook set to: %s", webhook_url)
             else:
                 logger.warning("Could not discover a public https URL; skipping webhook auto-registration.")
         else:
             webhook_url = f"https://{settings.webapp_domain}{settings.webhook_path}"
-            event_loop.run_until_complete(application.bot.set_webhook(url=webhook_url))
-            logger.info(f"Webhook set to: {webhook_url}")
+            event_loop.run_until_complete(
+                application.bot.set_webhook(
+                    url=webhook_url,
+                    secret_token=settings.webhook_secret or None,
+                    allowed_updates=ALLOWED_UPDATES,
+                )
+            )
+            logger.info("Webhook set to: %s", webhook_url)
 
         try:
             event_loop.run_forever()
@@ -197,10 +311,29 @@ def main() -> None:
             event_loop.run_until_complete(application.bot.delete_webhook())
             event_loop.run_until_complete(application.stop())
             event_loop.run_until_complete(application.shutdown())
+            event_loop.run_until_complete(_close_http_clients(application))
             event_loop.close()
     else:
+        if settings.bot_mode == "webhook":
+            external_base = discover_external_base_url(max_wait_seconds=5)
+            if external_base.startswith("https://"):
+                webhook_url = f"{external_base}/{settings.telegram_bot_token}"
+                logger.info(
+                    "Starting in standalone webhook mode",
+                    extra={"listen": settings.webhook_listen, "port": settings.webhook_port},
+                )
+                application.run_webhook(
+                    listen=settings.webhook_listen,
+                    port=settings.webhook_port,
+                    url_path=settings.telegram_bot_token,
+                    webhook_url=webhook_url,
+                    secret_token=settings.webhook_secret or None,
+                    allowed_updates=ALLOWED_UPDATES,
+                )
+                return
+            logger.warning("Could not discover a public https URL; falling back to polling.")
         logger.info("Starting in polling mode")
-        application.run_polling(allowed_updates=Update.ALL_TYPES)
+        application.run_polling(allowed_updates=ALLOWED_UPDATES, timeout=POLLING_TIMEOUT_SECONDS)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -11,6 +14,9 @@ class FoursquareSearchParams(BaseModel):
     max_price: int | None = Field(default=None, description="Maximum price (1=most affordable, 4=most expensive)")
     search_now: bool = Field(default=False, description="True if the user wants to trigger the search now, otherwise False.")
     explanation: str = Field(description="Explanation of how the query was parsed")
+    end_search: bool = Field(default=False, description="True if the user is declining further filters and wants to stop, e.g. 'no', 'that's all'")
+    results_header: str = Field(default="", description="Catchy one-line intro for the results of the merged search")
+    refine_prompt: str = Field(default="", description="Short, friendly question offering the filters that are still unset, or 'no' to finish")
 
 
 class UserInputClassifier(BaseModel):
@@ -24,6 +30,14 @@ class UserInputClassifier(BaseModel):
     explanation: str = Field(default="", description="Explanation for the response you provide")
 
 
+class IndexedUserInputClassifier(UserInputClassifier):
+    index: int = Field(description="The number of the input this result belongs to")
+
+
+class UserInputClassifierBatch(BaseModel):
+    results: list[IndexedUserInputClassifier] = Field(description="One parse result per numbered input")
+
+
 class AddressParseResult(BaseModel):
     is_valid: bool = Field(description="Whether the address could be parsed confidently")
     address: str = Field(default="", description="Street address or first line")
@@ -31,4 +45,44 @@ class AddressParseResult(BaseModel):
     region: str = Field(default="", description="State or province")
     postcode: str = Field(default="", description="Postal/ZIP code")
     country_code: str = Field(default="", description="2-letter country code, e.g. US, IN")
-    explanation: str = Field(default="", description="Short explanation if parsing failed or assumptions made") 
\ No newline at end of file
+    explanation: str = Field(default="", description="Short explanation if parsing failed or assumptions made") 
+
+
+class HoursParseResult(BaseModel):
+    is_valid: bool = Field(description="Whether the hours could be parsed confidently")
+    normalized_hours: str = Field(default="", description="Hours normalized like 'Mon-Sat 9:00 AM - 6:00 PM'")
+    explanation: str = Field(default="", description="Short explanation if parsing failed or assumptions made")
+
+
+class HoursApiParseResult(BaseModel):
+    is_valid: bool = Field(description="Whether the hours could be converted confidently")
+    hours: str = Field(default="", description="Foursquare hours string like '1,0900,1800;2,0900,1800'")
+    explanation: str = Field(default="", description="Short explanation if conversion failed or assumptions made")
+
+
+class WebAppPlacePayload(BaseModel):
+    name: str = Field(default="N/A", description="Place name submitted from the web app")
+    category: str = Field(default="N/A", description="Place category submitted from the web app")
+    address: str = Field(default="N/A", description="Place address submitted from the web app")
+
+
+@dataclass(slots=True)
+class PlaceDraft:
+    """Fields collected by the add-place conversation, kept in ``user_data["draft"]``."""
+
+    name: str = ""
+    categories_ids: str = ""
+    categories_names: list[str] = field(default_factory=list)
+    address_fields: dict[str, str] = field(default_factory=dict)
+    coordinates_source: Optional[str] = None
+    coordinates: Optional[dict[str, float]] = None
+    contact: dict[str, str] = field(default_factory=dict)
+    hours_api: str = ""
+    # Insertion-ordered set of attribute button labels; a dict (not a set)
+    # keeps the draft JSON-serializable for persistence.
+    attributes: dict[str, None] = field(default_factory=dict)
+    attributes_tokens: list[str] = field(default_factory=list)
+    is_private: Optional[bool] = None
+    # file_unique_id -> {"file_id", "file_size"}; a resent photo overwrites
+    # instead of counting twice.
+    photos: dict[str, dict[str, Any]] = field(default_factory=dict)
@@ -0,0 +1,169 @@
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from redis.asyncio import Redis
+from telegram.ext import BasePersistence, PersistenceInput
+
+from .config import settings
+
+
+ConversationKey = Tuple[int, ...]
+
+
+class RedisPersistence(BasePersistence[Dict[str, Any], Dict[str, Any], Dict[str, Any]]):
+    """
+    Store per-user conversation data and conversation states in Redis.
+
+    Only ``user_data`` and conversation states are persisted; chat, bot and
+    callback data stay in memory. Values are serialized with ``orjson``, so
+    everything placed in ``context.user_data`` must be JSON-serializable;
+    dataclasses such as ``PlaceDraft`` are written as objects and come back
+    as plain dicts.
+
+    Writes are buffered: ``Application.update_persistence`` calls the
+    ``update_*``/``drop_*`` hooks for every touched user and conversation at
+    once, and all of them are sent to Redis in a single pipeline instead of
+    one round-trip each.
+
+    Data is loaded once at startup and the in-memory copy is the source of
+    truth afterwards; nothing is re-read per update. Redis makes user data and
+    conversation states survive restarts, but replicas do not see each other's
+    changes, so a given user must keep hitting the same process.
+
+    Keys:
+        ``ud:<user_id>``      JSON blob with the user's ``user_data``.
+        ``conv:<name>``       Hash of ``"<chat_id>:<user_id>"`` -> JSON state.
+    """
+
+    def __init__(self, url: str | None = None, update_interval: float = 60):
+        super().__init__(
+            store_data=PersistenceInput(bot_data=False, chat_data=False, user_data=True, callback_data=False),
+            update_interval=update_interval,
+        )
+        self.redis: Redis = Redis.from_url(url or settings.redis_url)
+        # Pending writes; a value of None means delete.
+        self._pending_user_data: Dict[int, Optional[bytes]] = {}
+        self._pending_conversations: Dict[str, Dict[str, Optional[bytes]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _user_key(user_id: int) -> str:
+        return f"ud:{user_id}"
+
+    @staticmethod
+    def _conversation_key(name: str) -> str:
+        return f"conv:{name}"
+
+    async def get_user_data(self) -> Dict[int, Dict[str, Any]]:
+        keys = [key async for key in self.redis.scan_iter(match="ud:*")]
+        if not keys:
+            return {}
+        values = await self.redis.mget(keys)
+        user_data: Dict[int, Dict[str, Any]] = {}
+        for key, raw in zip(keys, values):
+            if raw is None:
+                continue
+            user_id = int(key.decode().split(":", 1)[1])
+            user_data[user_id] = orjson.loads(raw)
+        return user_data
+
+    async def update_user_data(self, user_id: int, data: Dict[str, Any]) -> None:
+        self._pending_user_data[user_id] = orjson.dumps(data)
+        await self._flush_soon()
+
+    async def drop_user_data(self, user_id: int) -> None:
+        self._pending_user_data[user_id] = None
+        await self._flush_soon()
+
+    async def refresh_user_data(self, user_id: int, user_data: Dict[str, Any]) -> None:
+        # Handler changes only reach the pending buffer on the next
+        # update_persistence run, so Redis can lag behind memory here.
+        pass
+
+    async def get_conversations(self, name: str) -> Dict[ConversationKey, object]:
+        raw = await self.redis.hgetall(self._conversation_key(name))
+        conversations: Dict[ConversationKey, object] = {}
+        for key, state in raw.items():
+            conversation_key = tuple(int(part) for part in key.decode().split(":"))
+            conversations[conversation_key] = orjson.loads(state)
+        return conversations
+
+    async def update_conversation(self, name: str, key: ConversationKey, new_state: Optional[object]) -> None:
+        field = ":".join(str(part) for part in key)
+        pending = self._pending_conversations.setdefault(name, {})
+        pending[field] = None if new_state is None else orjson.dumps(new_state)
+        await self._flush_soon()
+
+    async def claim_callback_query(self, query_id: str, ttl_seconds: int = 300) -> bool:
+        """Return True the first time ``query_id`` is seen across all replicas."""
+        return bool(await self.redis.set(f"cq:{query_id}", 1, nx=True, ex=ttl_seconds))
+
+    async def _flush_soon(self) -> None:
+        # All hooks called in the same update_persistence run share one flush
+        # task; errors still surface to PTB through each awaiting hook.
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        await asyncio.shield(self._flush_task)
+
+    async def _flush_pending(self) -> None:
+        while self._pending_user_data or self._pending_conversations:
+            user_data, self._pending_user_data = self._pending_user_data, {}
+            conversations, self._pending_conversations = self._pending_conversations, {}
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for user_id, raw in user_data.items():
+                        if raw is None:
+                            pipe.delete(self._user_key(user_id))
+                        else:
+                            pipe.set(self._user_key(user_id), raw)
+                    for name, fields in conversations.items():
+                        for field, raw in fields.items():
+                            if raw is None:
+                                pipe.hdel(self._conversation_key(name), field)
+                            else:
+                                pipe.hset(self._conversation_key(name), field, raw)
+                    await pipe.execute()
+            except BaseException:
+                # Put the batch back for the next flush, without clobbering
+                # anything queued while this one was in flight.
+                for user_id, raw in user_data.items():
+                    self._pending_user_data.setdefault(user_id, raw)
+                for name, fields in conversations.items():
+                    pending = self._pending_conversations.setdefault(name, {})
+                    for field, raw in fields.items():
+                        pending.setdefault(field, raw)
+                raise
+
+    async def flush(self) -> None:
+        await self._flush_pending()
+        await self.redis.aclose()
+
+    # Chat, bot and callback data are not persisted (see ``store_data``).
+
+    async def get_chat_data(self) -> Dict[int, Dict[str, Any]]:
+        return {}
+
+    async def update_chat_data(self, chat_id: int, data: Dict[str, Any]) -> None:
+        pass
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        pass
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: Dict[str, Any]) -> None:
+        pass
+
+    async def get_bot_data(self) -> Dict[str, Any]:
+        return {}
+
+    async def update_bot_data(self, data: Dict[str, Any]) -> None:
+        pass
+
+    async def refresh_bot_data(self, bot_data: Dict[str, Any]) -> None:
+        pass
+
+    async def get_callback_data(self) -> None:
+        return None
+
+    async def update_callback_data(self, data: Any) -> None:
+        pass
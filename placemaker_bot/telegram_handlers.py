@@ -1,9 +1,17 @@
+import asyncio
 import base64
-import json
-from typing import Dict, Any
+import functools
+import re
+from typing import Dict, Any, Optional
+
+import orjson
+from cachetools import LRUCache, TTLCache
+from pydantic import BaseModel, ValidationError
 
 from telegram import (
+    Bot,
     KeyboardButton,
+    Message,
     ReplyKeyboardMarkup,
     ReplyKeyboardRemove,
     Update,
@@ -17,14 +25,27 @@ from telegram.ext import (
 )
 from telegram.constants import ChatAction
 
+from .config import settings
 from .logging import build_log_extra, ensure_request_id, set_new_request_id
 from .logging import setup_logging
 from .llm import LLMClient
-from .models import FoursquareSearchParams, UserInputClassifier, AddressParseResult
-from .foursquare import FoursquareClient
-from .utils import discover_external_base_url
+from .models import (
+    AddressParseResult,
+    FoursquareSearchParams,
+    HoursApiParseResult,
+    HoursParseResult,
+    IndexedUserInputClassifier,
+    PlaceDraft,
+    UserInputClassifier,
+    UserInputClassifierBatch,
+    WebAppPlacePayload,
+)
+from .foursquare import FoursquareAPIError, FoursquareClient
+from .persistence import RedisPersistence
+from .utils import discover_external_base_url, stash_webapp_results
 
 from pathlib import Path
+from urllib.parse import urlencode
 
 logger = setup_logging()
 llm = LLMClient()
@@ -34,8 +55,7 @@ fsq = FoursquareClient()
 _FSQ_CATEGORIES_DOCS_URL = "https://docs.foursquare.com/data-products/docs/categories"
 _CATEGORIES_JSON_PATH = Path(__file__).parent / "assets" / "personalization-apis-movement-sdk-categories.json"
 try:
-    with open(_CATEGORIES_JSON_PATH, "r", encoding="utf-8") as _f:
-        _CATEGORY_NAME_TO_ID: Dict[str, str] = json.load(_f)
+    _CATEGORY_NAME_TO_ID: Dict[str, str] = orjson.loads(_CATEGORIES_JSON_PATH.read_bytes())
 except Exception:
     _CATEGORY_NAME_TO_ID = {}
 _CATEGORY_KEY_LOWER_TO_ID: Dict[str, str] = {k.strip().lower(): v for k, v in _CATEGORY_NAME_TO_ID.items()}
@@ -49,13 +69,44 @@ _ATTRIBUTES_KEYBOARD_LAYOUT: tuple[tuple[str, ...], ...] = (
     ("Done ✅",),
 )
 
-
-def _build_attributes_keyboard() -> ReplyKeyboardMarkup:
-    """Return a keyboard markup for selecting place attributes."""
-    return ReplyKeyboardMarkup(
-        [list(row) for row in _ATTRIBUTES_KEYBOARD_LAYOUT],
-        resize_keyboard=True,
-    )
+# Telegram objects are immutable once built, so static keyboards are created
+# once here and shared across handlers instead of being rebuilt per update.
+_ATTRIBUTES_KEYBOARD = ReplyKeyboardMarkup(
+    [list(row) for row in _ATTRIBUTES_KEYBOARD_LAYOUT],
+    resize_keyboard=True,
+)
+_START_KEYBOARD = ReplyKeyboardMarkup(
+    [[KeyboardButton("Share Location 📍", request_location=True)]],
+    resize_keyboard=True,
+)
+_COORDINATES_KEYBOARD = ReplyKeyboardMarkup(
+    [
+        [KeyboardButton("Use my current location")],
+        [KeyboardButton("Enter coordinates")],
+    ],
+    resize_keyboard=True,
+)
+_HOURS_KEYBOARD = ReplyKeyboardMarkup(
+    [[KeyboardButton("Open 24/7")], [KeyboardButton("Custom Hours")]],
+    resize_keyboard=True,
+)
+_PRIVATE_PLACE_KEYBOARD = ReplyKeyboardMarkup(
+    [[KeyboardButton("Yes"), KeyboardButton("No")]],
+    resize_keyboard=True,
+    one_time_keyboard=True,
+)
+_REMOVE_KEYBOARD = ReplyKeyboardRemove()
+# The location menu embeds a per-user map URL, so only its static rows are shared.
+_LOCATION_MENU_STATIC_ROWS = (
+    (KeyboardButton("Search Foursquare data"),),
+    (KeyboardButton("Add a new place"),),
+)
+_CONFIRM_KEYBOARD = InlineKeyboardMarkup(
+    [[
+        InlineKeyboardButton("Yes, Submit ✅", callback_data="confirm_yes"),
+        InlineKeyboardButton("No, Edit ✏️", callback_data="confirm_no"),
+    ]]
+)
 
 
 (
@@ -80,6 +131,50 @@ def _build_attributes_keyboard() -> ReplyKeyboardMarkup:
 ) = range(18)
 
 
+# Menu button text (lowercased) -> next state.
+_LOCATION_MENU_CHOICES: Dict[str, int] = {
+    "search foursquare data": QUERY,
+    "add a new place": NAME,
+}
+_HOURS_24_7 = ";".join(f"{day},0000,2400" for day in range(1, 8))
+# Hours button text (lowercased) -> Foursquare hours string; None asks for custom hours.
+_HOURS_CHOICES: Dict[str, Optional[str]] = {
+    "open 24/7": _HOURS_24_7,
+    "custom hours": None,
+}
+
+# Coordinates button text (and typed variants) -> "current" or "manual".
+_COORDINATES_CHOICES: Dict[str, str] = {
+    "use my current location": "current",
+    "use my location": "current",
+    "enter coordinates": "manual",
+    "enter coordinate": "manual",
+    "enter": "manual",
+}
+_PRIVATE_PLACE_CHOICES: Dict[str, bool] = {"yes": True, "y": True, "no": False, "n": False}
+
+_SKIP_TOKENS = frozenset({"skip", "/skip"})
+_SKIP_OR_DONE_COMMANDS = frozenset({"/skip", "/done"})
+
+
+def _is_skip(text: str) -> bool:
+    # Length check first so ordinary answers never pay for a lowercased copy.
+    return len(text) <= 5 and text.lower() in _SKIP_TOKENS
+
+
+def _send_typing(context: ContextTypes.DEFAULT_TYPE, chat_id: int) -> None:
+    """Show "typing..." without putting the Bot API round trip in front of the real work."""
+    context.application.create_task(context.bot.send_chat_action(chat_id=chat_id, action=ChatAction.TYPING))
+
+
+def _choice_text(message: Message) -> str:
+    """Lowercased menu/choice text; only strips when Telegram left outer whitespace."""
+    text = message.text or ""
+    if text[:1].isspace() or text[-1:].isspace():
+        text = text.strip()
+    return text.lower()
+
+
 def _is_valid_categories(value: str) -> bool:
     # Allow comma-separated FSQ category IDs (alphanumeric tokens)
     tokens = [t.strip() for t in str(value).split(',') if t.strip()]
@@ -126,6 +221,39 @@ def _sanitize_suggest_params(raw: Dict[str, Any]) -> Dict[str, Any]:
     return params
 
 
+def _share_search_parses(maxsize: int = 2048):
+    """
+    Memoize ``parse_search_query_gpt`` on normalized text plus the current filters.
+
+    The cache holds tasks rather than results, so concurrent identical queries
+    share one in-flight completion. Failed calls are evicted; callers get a copy.
+    """
+    def decorator(func):
+        cache: LRUCache = LRUCache(maxsize=maxsize)
+
+        @functools.wraps(func)
+        async def wrapper(user_input: str, current_params: dict | None = None) -> Any:
+            filters = _build_search_request_params(current_params or {})
+            key = (" ".join(user_input.lower().split()), tuple(sorted(filters.items())))
+            task = cache.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(user_input, current_params))
+                cache[key] = task
+            try:
+                result = await asyncio.shield(task)
+            except Exception:
+                if cache.get(key) is task:
+                    del cache[key]
+                raise
+            return _copy_parse_result(result)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+@_share_search_parses()
 async def parse_search_query_gpt(user_input: str, current_params: dict | None = None) -> Any:
     current_params = current_params or {}
     user_prompt = f"""
@@ -135,14 +263,20 @@ async def parse_search_query_gpt(user_input: str, current_params: dict | None =
         Also, parse any additional filters the user provides (open now, radius, min_price, max_price, etc). If a field is not mentioned, leave it as null.
         min_price and max_price are integers from 1 (most affordable) to 4 (most expensive).
         Here are the current search parameters (if any):
-        {json.dumps(current_params)}
+        {orjson.dumps(current_params).decode()}
         Merge any new information from the user with these existing parameters. If the user provides a new value for a field, overwrite the old one.
         
         If the user message indicates they want to see the results now (e.g., 'search now', 'show me the results', 'that's it', 'done', etc.), set 'search_now' to true. Otherwise, set it to false.
-        
+
+        If the user is declining to add more filters and wants to stop (e.g., 'no', 'that's all', 'I'm done', 'stop'), set 'end_search' to true. Otherwise, set it to false.
+
+        Also write, for the merged search:
+        - results_header: a single, catchy, human-like one-liner introducing the results, specific to the query if possible (e.g., 'Here are some top burger spots you might want to check out'). No emojis.
+        - refine_prompt: a short, natural question suggesting the user can add any filters that are still unset (distance, open now, minimum price, maximum price) to narrow down the results, or say 'no' to finish. No emojis.
+
         User input: {user_input}
     """
-    parsed = llm.parse(
+    parsed = await llm.parse(
         messages=[
             {"role": "system", "content": "You are a parsing assistant."},
             {"role": "user", "content": user_prompt},
@@ -152,51 +286,93 @@ async def parse_search_query_gpt(user_input: str, current_params: dict | None =
     return parsed
 
 
-async def suggest_next_filters(params: dict) -> str:
-    missing: list[str] = []
-    if not params.get("radius"):
-        missing.append("distance")
-    if not params.get("open_now"):
-        missing.append("open now")
-    if not params.get("min_price"):
-        missing.append("minimum price")
-    if not params.get("max_price"):
-        missing.append("maximum price")
-    user_context: list[str] = []
-    for k, v in params.items():
-        if v is not None and v != "":
-            user_context.append(f"{k}: {v}")
-    gpt_prompt = f"""
-        You are a friendly assistant helping a user search for places. The user has already set these filters: {', '.join(user_context) if user_context else 'none yet'}.
-        The following filters are still missing: {', '.join(missing)}.
-        In a natural, conversational way, ask the user if they want to specify any of these missing filters. Do not use a robotic or templated tone. Make it sound like a real human would ask in a chat.
-        Keep it short and friendly. Don't use any emojis.
+def _copy_parse_result(result: Any) -> Any:
+    return result.model_copy(deep=True) if isinstance(result, BaseModel) else dict(result)
+
+
+def _cache_valid_parses(maxsize: int = 1024):
     """
-    return llm.chat(
-        temperature=1,
-        messages=[
-            {"role": "system", "content": "You are a helpful, friendly assistant."},
-            {"role": "user", "content": gpt_prompt},
-        ],
-    )
+    Memoize an async ``parse_*_gpt(user_input)`` helper on whitespace-normalized input.
 
+    Works for helpers returning a dict or a pydantic model with ``is_valid``.
+    Only valid results are kept, so a one-off bad LLM answer is retried next
+    time instead of sticking. Callers get a copy of the cached result.
+    """
+    def decorator(func):
+        cache: LRUCache = LRUCache(maxsize=maxsize)
+
+        @functools.wraps(func)
+        async def wrapper(user_input: str) -> Any:
+            key = " ".join(user_input.split())
+            cached = cache.get(key)
+            if cached is not None:
+                return _copy_parse_result(cached)
+            result = await func(user_input)
+            is_valid = getattr(result, "is_valid", False) if isinstance(result, BaseModel) else result.get("is_valid")
+            if is_valid:
+                cache[key] = _copy_parse_result(result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+# Static instructions are sent as their own message ahead of the user input so
+# the prompt prefix is byte-identical across calls and hits the provider cache.
+_CONTACT_PARSE_INSTRUCTIONS = """
+You are a helpful assistant. The user is entering contact details and social links in free text.
+Parse any of these fields you can find: phone, website, email, facebookUrl, instagram, twitter.
+If a field isn't provided, return an empty string for it.
+Set is_valid=false only if the content is clearly unrelated to contact/social information.
+""".strip()
+
+_HOURS_PARSE_INSTRUCTIONS = (
+    "Normalize the user's free-text operating hours to a consistent format like "
+    "'Mon-Sat 9:00 AM - 6:00 PM'. If the input is ambiguous, set is_valid=false and explain why."
+)
 
-async def parse_contact_info_gpt(user_input: str) -> Dict[str, Any]:
-    user_prompt = f"""
-        You are a helpful assistant. The user is entering contact details and social links in free text.
-        Parse any of these fields you can find: phone, website, email, facebookUrl, instagram, twitter.
-        If a field isn't provided, return an empty string for it.
-        Set is_valid=false only if the content is clearly unrelated to contact/social information.
 
-        User input: {user_input}
-        """
-    parsed = llm.parse(
-        messages=[
-            {"role": "system", "content": "You are a parsing assistant."},
-            {"role": "user", "content": user_prompt},
-        ],
-        response_format=UserInputClassifier,
-    )
+_HOURS_API_INSTRUCTIONS = """
+Convert the following operating hours into the Foursquare Places API hours string.
+Format: a semicolon-separated list of entries: day,start,end or day,start,end,label.
+Days: 1=Monday ... 7=Sunday. Times: HHMM 24-hour format. Prefix + if end time goes past midnight.
+Examples:
+- 24/7: 1,0000,2400;2,0000,2400;3,0000,2400;4,0000,2400;5,0000,2400;6,0000,2400;7,0000,2400
+""".strip()
+
+_ADDRESS_PARSE_INSTRUCTIONS = """
+You are parsing a place address from free text. Extract the following fields when possible:
+- address (street address)
+- locality (city)
+- region (state or province)
+- postcode (postal/zip code)
+- country_code (2-letter code like US, IN. You can extract the country code from the input if it is present.)
+If you are unsure, leave the field empty. Set is_valid=false only if the input clearly isn't an address.
+The country_code is also a mandatory field. If you are unable to extract the country code, set is_valid=false.
+""".strip()
+
+_CATEGORIES_PARSE_INSTRUCTIONS = """
+Extract category-like terms from the user's message.
+- Output a comma-separated list of short category names or phrases present or clearly implied by the user input.
+- Keep names concise (1-3 words). Use only what the user said; do not invent unseen categories.
+- Normalize by removing emojis and extraneous punctuation.
+- Split combined phrases like 'bars and cafes' into 'bar, cafe'.
+- If nothing category-like is present, return an empty string.
+
+Reply with CSV only and no extra text.
+""".strip()
+
+_COORDINATES_PARSE_INSTRUCTIONS = """
+Extract latitude and longitude from the input. The user will provide comma-separated values.
+Return strict JSON with keys: {"is_valid": <bool>, "latitude": <float or null>, "longitude": <float or null>, "explanation": "<string>"}.
+- Accept variations like spaces or labels (e.g., "lat: 12.34, lng: 56.78").
+- Validate ranges (lat: -90..90, lng: -180..180). If out of range, set is_valid=false.
+""".strip()
+
+
+def _contact_result(parsed: UserInputClassifier) -> Dict[str, Any]:
     return {
         "is_valid": parsed.is_valid,
         "phone": parsed.phone,
@@ -208,156 +384,162 @@ async def parse_contact_info_gpt(user_input: str) -> Dict[str, Any]:
     }
 
 
-async def parse_hours_info_gpt(user_input: str) -> Dict[str, Any]:
-    user_prompt = f"""
-        You are a helpful assistant. The user is entering custom operating hours in free text.
-        Examples might be "Mon-Sat 9am to 6pm" or "M-F 10-2AM". 
-        They can use different separators or day abbreviations.
-
-        1. Read the user's text, parse out a consistent operating-hours format,
-        e.g. "Mon-Sat 9:00 AM - 6:00 PM".
-        2. If you cannot confidently parse or if the user's input is ambiguous, 
-        respond with is_valid=false and include an explanation.
-        3. Return only valid JSON:
-        {{
-            "is_valid": <true/false>,
-            "normalized_hours": "<string or empty>",
-            "explanation": "<string>"
-        }}
-
-        User input: {user_input}
-
-        Return valid JSON only, with no extra keys or text outside the JSON. Don't start or end the json with ```json etc.
-        """
-    response = llm.chat(
+async def _parse_contact_info_one(user_input: str) -> Dict[str, Any]:
+    parsed = await llm.parse(
         messages=[
             {"role": "system", "content": "You are a parsing assistant."},
-            {"role": "user", "content": user_prompt},
+            {"role": "user", "content": _CONTACT_PARSE_INSTRUCTIONS},
+            {"role": "user", "content": f"User input: {user_input}"},
         ],
+        response_format=UserInputClassifier,
     )
-    msg = json.loads(response)
-    return {
-        "is_valid": msg["is_valid"],
-        "normalized_hours": msg["normalized_hours"],
-        "explanation": msg["explanation"],
-    }
+    return _contact_result(parsed)
 
 
-async def parse_hours_to_api_gpt(user_input: str) -> Dict[str, Any]:
-    user_prompt = f"""
-        Convert the following operating hours into the Foursquare Places API hours string.
-        Format: a semicolon-separated list of entries: day,start,end or day,start,end,label.
-        Days: 1=Monday ... 7=Sunday. Times: HHMM 24-hour format. Prefix + if end time goes past midnight.
-        Examples:
-        - 24/7: 1,0000,2400;2,0000,2400;3,0000,2400;4,0000,2400;5,0000,2400;6,0000,2400;7,0000,2400
-
-        Input: {user_input}
-
-        Return valid JSON only with keys: {{"is_valid": <bool>, "hours": "<string or empty>", "explanation": "<string>"}}
-    """
-    response = llm.chat(
+async def _parse_contact_info_many(user_inputs: list[str]) -> list[Dict[str, Any]]:
+    numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(user_inputs, 1))
+    parsed = await llm.parse(
         messages=[
             {"role": "system", "content": "You are a parsing assistant."},
-            {"role": "user", "content": user_prompt},
+            {"role": "user", "content": _CONTACT_PARSE_INSTRUCTIONS},
+            {
+                "role": "user",
+                "content": (
+                    "Parse each numbered input separately and return one result per input, "
+                    f"with index set to that input's number.\n{numbered}"
+                ),
+            },
         ],
+        response_format=UserInputClassifierBatch,
     )
-    msg = json.loads(response)
-    return {"is_valid": msg["is_valid"], "hours": msg["hours"], "explanation": msg["explanation"]}
-
+    by_index: Dict[int, Optional[IndexedUserInputClassifier]] = {}
+    for result in parsed.results:
+        # A repeated index is ambiguous; drop it and parse that input on its own.
+        by_index[result.index] = None if result.index in by_index else result
+    matched = [by_index.get(i) for i in range(1, len(user_inputs) + 1)]
+    missing = [text for text, result in zip(user_inputs, matched) if result is None]
+    if missing:
+        logger.warning("contact batch returned %d unmatched results; parsing them one by one", len(missing))
+    retried = iter(await asyncio.gather(*(_parse_contact_info_one(text) for text in missing)))
+    return [_contact_result(result) if result is not None else next(retried) for result in matched]
+
+
+class _ParseBatcher:
+    """
+    Coalesce concurrent parse calls into one LLM request.
 
-async def parse_address_info_gpt(user_input: str) -> AddressParseResult:
-    user_prompt = f"""
-        You are parsing a place address from free text. Extract the following fields when possible:
-        - address (street address)
-        - locality (city)
-        - region (state or province)
-        - postcode (postal/zip code)
-        - country_code (2-letter code like US, IN. You can extract the country code from the input if it is present.)
-        If you are unsure, leave the field empty. Set is_valid=false only if the input clearly isn't an address.
-        The country_code is also a mandatory field. If you are unable to extract the country code, set is_valid=false.
-
-        Input: {user_input}
+    The first caller opens a short window; everything submitted before it
+    closes (or until ``max_batch`` inputs are queued) goes out together. A lone
+    input uses the single-input prompt, and a failed or mismatched batch
+    falls back to one request per input so callers never see batch errors.
     """
-    parsed = llm.parse(
+
+    def __init__(self, parse_one, parse_many, window_seconds: float = 0.075, max_batch: int = 8):
+        self._parse_one = parse_one
+        self._parse_many = parse_many
+        self._window_seconds = window_seconds
+        self._max_batch = max_batch
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, user_input: str) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((user_input, future))
+        if len(self._pending) >= self._max_batch:
+            self._drain()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_seconds, self._drain)
+        return await future
+
+    def _drain(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        inputs = [user_input for user_input, _ in batch]
+        if len(batch) == 1:
+            results = await asyncio.gather(self._parse_one(inputs[0]), return_exceptions=True)
+        else:
+            try:
+                results = await self._parse_many(inputs)
+            except Exception:
+                logger.warning("batched parse failed; retrying inputs one by one", exc_info=True)
+                results = await asyncio.gather(*(self._parse_one(text) for text in inputs), return_exceptions=True)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_CONTACT_PARSE_BATCHER = _ParseBatcher(_parse_contact_info_one, _parse_contact_info_many)
+
+
+@_cache_valid_parses()
+async def parse_contact_info_gpt(user_input: str) -> Dict[str, Any]:
+    return await _CONTACT_PARSE_BATCHER.submit(user_input)
+
+
+@_cache_valid_parses()
+async def parse_hours_info_gpt(user_input: str) -> Dict[str, Any]:
+    parsed = await llm.parse(
         messages=[
             {"role": "system", "content": "You are a parsing assistant."},
-            {"role": "user", "content": user_prompt},
+            {"role": "user", "content": _HOURS_PARSE_INSTRUCTIONS},
+            {"role": "user", "content": f"User input: {user_input}"},
         ],
-        response_format=AddressParseResult,
+        response_format=HoursParseResult,
     )
-    return parsed
+    return parsed.model_dump()
 
 
-async def gpt_suggest_refine_prompt(params: dict) -> str:
-    missing: list[str] = []
-    if not params.get("radius"):
-        missing.append("distance")
-    if not params.get("open_now"):
-        missing.append("open now")
-    if not params.get("min_price"):
-        missing.append("minimum price")
-    if not params.get("max_price"):
-        missing.append("maximum price")
-    user_context: list[str] = []
-    for k, v in params.items():
-        if v is not None and v != "" and k != "query":
-            user_context.append(f"{k}: {v}")
-    gpt_prompt = f"""
-        You are a friendly assistant helping a user search for places. The user has already set these filters: {', '.join(user_context) if user_context else 'none yet'}.
-        The following filters are still missing: {', '.join(missing)}.
-        In a natural, conversational way, suggest to the user that they can add any of these missing filters to narrow down the results, or say 'no' to finish. Do not use a robotic or templated tone. Make it sound like a real human would ask in a chat. Keep it short and friendly. Don't use any emojis.
-    """
-    return llm.chat(
-        temperature=1,
+@_cache_valid_parses()
+async def parse_hours_to_api_gpt(user_input: str) -> Dict[str, Any]:
+    parsed = await llm.parse(
         messages=[
-            {"role": "system", "content": "You are a helpful, friendly assistant."},
-            {"role": "user", "content": gpt_prompt},
+            {"role": "system", "content": "You are a parsing assistant."},
+            {"role": "user", "content": _HOURS_API_INSTRUCTIONS},
+            {"role": "user", "content": f"Input: {user_input}"},
         ],
+        response_format=HoursApiParseResult,
     )
+    return parsed.model_dump()
 
 
-async def gpt_generate_results_header(params: dict) -> str:
-    query = params.get("query", None)
-    user_context: list[str] = []
-    for k, v in params.items():
-        if v is not None and v != "" and k != "query":
-            user_context.append(f"{k}: {v}")
-    gpt_prompt = f"""
-        You are a friendly assistant helping a user search for places. The user is about to see a list of results for their search. 
-        The main search keyword is: {query if query else 'unknown'}.
-        The user has set these filters: {', '.join(user_context) if user_context else 'none'}.
-        Write a single, catchy, human-like one-liner to introduce the results. 
-        Make it specific to the query if possible (e.g., 'Here are some top burger spots you might want to check out', 'Let your pizza journey begin—these delicious destinations await', 'Looking for the best coffee in town? Start with these places').
-        If the query is missing, use a generic but still friendly intro. Do not use emojis. Keep it short and engaging.
-    """
-    return llm.chat(
-        temperature=1,
+@_cache_valid_parses()
+async def parse_address_info_gpt(user_input: str) -> AddressParseResult:
+    parsed = await llm.parse(
         messages=[
-            {"role": "system", "content": "You are a helpful, friendly assistant."},
-            {"role": "user", "content": gpt_prompt},
+            {"role": "system", "content": "You are a parsing assistant."},
+            {"role": "user", "content": _ADDRESS_PARSE_INSTRUCTIONS},
+            {"role": "user", "content": f"Input: {user_input}"},
         ],
+        response_format=AddressParseResult,
     )
+    return parsed
 
 
 # --- Category parsing helpers ---
 async def parse_categories_gpt(user_input: str, valid_names: list[str]) -> list[str]:
-    prompt = f"""
-    Extract category-like terms from the user's message.
-    - Output a comma-separated list of short category names or phrases present or clearly implied by the user input.
-    - Keep names concise (1-3 words). Use only what the user said; do not invent unseen categories.
-    - Normalize by removing emojis and extraneous punctuation.
-    - Split combined phrases like 'bars and cafes' into 'bar, cafe'.
-    - If nothing category-like is present, return an empty string.
-
-    Reply with CSV only and no extra text.
-
-    User input: {user_input}
-    """
-    raw = llm.chat(
+    # Short keyword extraction: route to the parse model and cap the output.
+    raw = await llm.chat(
+        model=llm.parse_model,
         temperature=0,
+        max_tokens=64,
         messages=[
             {"role": "system", "content": "You extract concise keywords and output CSV only."},
-            {"role": "user", "content": prompt},
+            {"role": "user", "content": _CATEGORIES_PARSE_INSTRUCTIONS},
+            {"role": "user", "content": f"User input: {user_input}"},
         ],
     )
     tokens = [t.strip().strip('"\'') for t in raw.split(',') if t.strip()]
@@ -373,31 +555,166 @@ async def parse_categories_gpt(user_input: str, valid_names: list[str]) -> list[
 
 
 # --- Coordinates parsing helper ---
+@_cache_valid_parses()
 async def parse_coordinates_gpt(user_input: str) -> Dict[str, Any]:
-    user_prompt = f"""
-        Extract latitude and longitude from the input. The user will provide comma-separated values.
-        Return strict JSON with keys: {{"is_valid": <bool>, "latitude": <float or null>, "longitude": <float or null>, "explanation": "<string>"}}.
-        - Accept variations like spaces or labels (e.g., "lat: 12.34, lng: 56.78").
-        - Validate ranges (lat: -90..90, lng: -180..180). If out of range, set is_valid=false.
-
-        Input: {user_input}
-    """
-    response = llm.chat(
+    response = await llm.chat(
+        model=llm.parse_model,
+        max_tokens=128,
         messages=[
             {"role": "system", "content": "You are a parsing assistant."},
-            {"role": "user", "content": user_prompt},
+            {"role": "user", "content": _COORDINATES_PARSE_INSTRUCTIONS},
+            {"role": "user", "content": f"Input: {user_input}"},
         ],
     )
     try:
-        msg = json.loads(response)
+        msg = orjson.loads(response)
     except Exception:
         msg = {"is_valid": False, "latitude": None, "longitude": None, "explanation": "Failed to parse"}
     return msg
 
 
-async def do_foursquare_search(update: Update, context: ContextTypes.DEFAULT_TYPE, ask_refine: bool = False) -> int:
+# Recent /places/search results keyed on rounded coordinates (~11 m) and the
+# request params. open_now answers go stale quickly, so they get a short TTL.
+_FSQ_SEARCH_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=300)
+_FSQ_OPEN_NOW_SEARCH_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=30)
+_FSQ_SEARCH_IN_FLIGHT: Dict[tuple, asyncio.Future] = {}
+
+
+async def _search_places_cached(lat: float, lng: float, fields: str, request_params: Dict[str, Any]) -> list[Dict[str, Any]]:
+    cache = _FSQ_OPEN_NOW_SEARCH_CACHE if request_params.get("open_now") else _FSQ_SEARCH_CACHE
+    key = (round(lat, 4), round(lng, 4), fields, tuple(sorted(request_params.items())))
+    results = cache.get(key)
+    if results is None:
+        # Identical searches already in flight share one request.
+        task = _FSQ_SEARCH_IN_FLIGHT.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fsq.search(ll=f"{lat},{lng}", fields=fields, params=request_params))
+            _FSQ_SEARCH_IN_FLIGHT[key] = task
+            task.add_done_callback(lambda _: _FSQ_SEARCH_IN_FLIGHT.pop(key, None))
+        data = await asyncio.shield(task)
+        results = data.get("results", [])
+        cache[key] = results
+    # Callers annotate places (image_url), so hand out copies.
+    return [dict(place) for place in results]
+
+
+# fsq_place_id -> thumbnail URL (None when the place has no photos). Photo
+# URLs are stable, so refine turns that return the same places skip the API.
+_FSQ_IMAGE_URL_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+
+async def _attach_image_url(update: Update, context: ContextTypes.DEFAULT_TYPE, place: Dict[str, Any]) -> None:
+    fsq_id = place.get("fsq_place_id")
+    if not fsq_id:
+        place["image_url"] = None
+        return
+    if fsq_id in _FSQ_IMAGE_URL_CACHE:
+        place["image_url"] = _FSQ_IMAGE_URL_CACHE[fsq_id]
+        return
+    try:
+        # Only the first photo is rendered, so don't fetch the rest.
+        photo_list = await fsq.photos(fsq_id, limit=1)
+        try:
+            photos_count = len(photo_list) if isinstance(photo_list, list) else 0
+            logger.info(
+                "fsq photos fetched",
+                extra=build_log_extra(
+                    update,
+                    context,
+                    module_name="search",
+                    operation="do_foursquare_search",
+                    fsq_id=fsq_id,
+                    photos_count=photos_count,
+                ),
+            )
+        except Exception:
+            logger.info(
+                "fsq photos fetched",
+                extra=build_log_extra(
+                    update,
+                    context,
+                    module_name="search",
+                    operation="do_foursquare_search",
+                    fsq_id=fsq_id,
+                ),
+            )
+        if isinstance(photo_list, list) and len(photo_list) > 0:
+            photo = photo_list[0]
+            prefix = photo.get("prefix", "")
+            suffix = photo.get("suffix", "")
+            width = photo.get("width", 300)
+            height = photo.get("height", 225)
+            target_w = 300
+            target_h = int((target_w / width) * height) if width and height else 225
+            image_url = f"{prefix}{target_w}x{target_h}{suffix}"
+            place["image_url"] = image_url
+        else:
+            place["image_url"] = None
+        _FSQ_IMAGE_URL_CACHE[fsq_id] = place["image_url"]
+    except Exception:
+        try:
+            logger.info(
+                "fsq photos fetch failed",
+                extra=build_log_extra(
+                    update,
+                    context,
+                    module_name="search",
+                    operation="do_foursquare_search",
+                    fsq_id=fsq_id,
+                ),
+            )
+        except Exception:
+            pass
+        place["image_url"] = None
+
+
+# search_params keys passed straight through to the Places search endpoint.
+_SEARCH_PARAM_KEYS = frozenset({"query", "open_now", "radius", "fsq_category_ids", "min_price", "max_price"})
+_SEARCH_FIELDS = "fsq_place_id,name,distance,hours,price,rating"
+
+
+def _build_search_request_params(search_params: Dict[str, Any]) -> Dict[str, Any]:
+    request_params: Dict[str, Any] = {
+        key: value for key, value in search_params.items() if key in _SEARCH_PARAM_KEYS and value
+    }
+    request_params["limit"] = search_params.get("limit") or 5
+    if "open_now" in request_params:
+        request_params["open_now"] = "true"
+    return request_params
+
+
+_PLACE_TEMPLATE = "<b>{name}</b>\nRating: {rating}\nPricing: {price}\nStatus: {status}\nDistance: {distance}m away"
+# Foursquare price tiers 1-4; anything else renders as N/A.
+_PRICE_STR = {tier: f"<b>{'$' * tier}</b>" for tier in range(1, 5)}
+_PRICE_STR.update({str(tier): text for tier, text in _PRICE_STR.items()})
+_OPEN_NOW_STR = {True: "<b>Open Now</b>", False: "<b>Currently Closed!</b>"}
+
+
+def _format_place(place: Dict[str, Any]) -> str:
+    rating = place.get("rating")
+    hours = place.get("hours")
+    return _PLACE_TEMPLATE.format(
+        name=place.get("name", "Unknown"),
+        rating="N/A" if rating is None or rating == "" else f"{rating}/10 ⭐",
+        price=_PRICE_STR.get(place.get("price"), "N/A"),
+        status=_OPEN_NOW_STR.get(hours.get("open_now"), "N/A") if isinstance(hours, dict) else "N/A",
+        distance=place.get("distance", "N/A"),
+    )
+
+
+_DEFAULT_RESULTS_HEADER = "Here are some places you might like:"
+_DEFAULT_REFINE_PROMPT = "Want to narrow these down? Add a distance, open now, or a price range, or say 'no' to finish."
+
+
+async def do_foursquare_search(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ask_refine: bool = False,
+    header: str = "",
+    refine_prompt: str = "",
+) -> int:
     ensure_request_id(update, context)
-    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+    _send_typing(context, update.effective_chat.id)
 
     location = context.user_data.get("location")
     if not isinstance(location, dict):
@@ -420,22 +737,8 @@ async def do_foursquare_search(update: Update, context: ContextTypes.DEFAULT_TYP
         return LOCATION
 
     search_params: dict = context.user_data.get("search_params", {})
-    fields = "fsq_place_id,name,distance,hours,price,rating"
-
-    request_params: Dict[str, Any] = {}
-    if search_params.get("query"):
-        request_params["query"] = search_params["query"]
-    request_params["limit"] = search_params.get("limit") or 5
-    if search_params.get("open_now"):
-        request_params["open_now"] = "true"
-    if search_params.get("radius"):
-        request_params["radius"] = search_params["radius"]
-    if search_params.get("fsq_category_ids"):
-        request_params["fsq_category_ids"] = search_params["fsq_category_ids"]
-    if search_params.get("min_price"):
-        request_params["min_price"] = search_params["min_price"]
-    if search_params.get("max_price"):
-        request_params["max_price"] = search_params["max_price"]
+    fields = _SEARCH_FIELDS
+    request_params = _build_search_request_params(search_params)
 
     logger.info(
         "foursquare search request",
@@ -450,8 +753,7 @@ async def do_foursquare_search(update: Update, context: ContextTypes.DEFAULT_TYP
     )
 
     try:
-        data = fsq.search(ll=f"{lat},{lng}", fields=fields, params=request_params)
-        results = data.get("results", [])
+        results = await _search_places_cached(lat, lng, fields, request_params)
         logger.info(
             "foursquare search response",
             extra=build_log_extra(
@@ -490,113 +792,28 @@ async def do_foursquare_search(update: Update, context: ContextTypes.DEFAULT_TYP
                 extra=build_log_extra(update, context, module_name="search", operation="do_foursquare_search"),
             )
 
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+        _send_typing(context, update.effective_chat.id)
 
-        for place in results:
-            fsq_id = place.get("fsq_place_id")
-            if not fsq_id:
-                place["image_url"] = None
-                continue
-            try:
-                photo_list = fsq.photos(fsq_id)
-                try:
-                    photos_count = len(photo_list) if isinstance(photo_list, list) else 0
-                    logger.info(
-                        "fsq photos fetched",
-                        extra=build_log_extra(
-                            update,
-                            context,
-                            module_name="search",
-                            operation="do_foursquare_search",
-                            fsq_id=fsq_id,
-                            photos_count=photos_count,
-                        ),
-                    )
-                except Exception:
-                    logger.info(
-                        "fsq photos fetched",
-                        extra=build_log_extra(
-                            update,
-                            context,
-                            module_name="search",
-                            operation="do_foursquare_search",
-                            fsq_id=fsq_id,
-                        ),
-                    )
-                if isinstance(photo_list, list) and len(photo_list) > 0:
-                    photo = photo_list[0]
-                    prefix = photo.get("prefix", "")
-                    suffix = photo.get("suffix", "")
-                    width = photo.get("width", 300)
-                    height = photo.get("height", 225)
-                    target_w = 300
-                    target_h = int((target_w / width) * height) if width and height else 225
-                    image_url = f"{prefix}{target_w}x{target_h}{suffix}"
-                    place["image_url"] = image_url
-                else:
-                    place["image_url"] = None
-            except Exception:
-                try:
-                    logger.info(
-                        "fsq photos fetch failed",
-                        extra=build_log_extra(
-                            update,
-                            context,
-                            module_name="search",
-                            operation="do_foursquare_search",
-                            fsq_id=fsq_id,
-                        ),
-                    )
-                except Exception:
-                    pass
-                place["image_url"] = None
+        # One photo lookup per place, issued concurrently over the shared session.
+        await asyncio.gather(*(_attach_image_url(update, context, place) for place in results))
 
         if not results:
             await update.message.reply_text("No places found with your filters. Type a new query or /start to try again.")
             return QUERY
 
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
-        header = await gpt_generate_results_header(search_params)
-        lines: list[str] = []
-        for place in results:
-            name = place.get("name", "Unknown")
-            dist = place.get("distance", "N/A")
-            rating = place.get("rating", None)
-            if rating is not None and rating != "":
-                rating_str = f"{rating}/10 ⭐"
-            else:
-                rating_str = "N/A"
-            price = place.get("price", None)
-            if price is not None and price != "":
-                try:
-                    price_int = int(price)
-                    price_str = f"<b>{'$' * price_int}</b>"
-                except Exception:
-                    price_str = "N/A"
-            else:
-                price_str = "N/A"
-            open_now = place.get("hours", {}).get("open_now", None)
-            if open_now is True:
-                open_str = "<b>Open Now</b>"
-            elif open_now is False:
-                open_str = "<b>Currently Closed!</b>"
-            else:
-                open_str = "N/A"
-            place_msg = (
-                f"<b>{name}</b>\n"
-                f"Rating: {rating_str}\n"
-                f"Pricing: {price_str}\n"
-                f"Status: {open_str}\n"
-                f"Distance: {dist}m away"
-            )
-            lines.append(place_msg)
-        reply = header + "\n\n" + "\n\n".join(lines)
+        reply = (header or _DEFAULT_RESULTS_HEADER) + "\n\n" + "\n\n".join(map(_format_place, results))
         await update.message.reply_text(reply, parse_mode="HTML")
 
-        places_json = json.dumps(results)
-        places_b64 = base64.urlsafe_b64encode(places_json.encode()).decode()
         external_base = discover_external_base_url(max_wait_seconds=1)
-        webapp_url = f"{external_base}/?data={places_b64}"
+        if settings.use_webhook and not settings.redis_url:
+            # The in-process Flask server serves the web app, so hand it the
+            # results directly and keep the button URL short. The stash is
+            # per-process, so with Redis (several replicas) the fetch may land
+            # elsewhere; the payload then travels in the URL instead.
+            webapp_url = f"{external_base}/?id={stash_webapp_results(results)}"
+        else:
+            places_b64 = base64.urlsafe_b64encode(orjson.dumps(results)).decode()
+            webapp_url = f"{external_base}/?data={places_b64}"
         keyboard = [[InlineKeyboardButton("Open List View", url=webapp_url)]]
         reply_markup = InlineKeyboardMarkup(keyboard)
         await update.message.reply_text(
@@ -605,71 +822,60 @@ async def do_foursquare_search(update: Update, context: ContextTypes.DEFAULT_TYP
         )
 
         if ask_refine:
-            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
-            refine_prompt = await gpt_suggest_refine_prompt(search_params)
-            await update.message.reply_text(refine_prompt)
+            await update.message.reply_text(refine_prompt or _DEFAULT_REFINE_PROMPT)
             return REFINE
         return QUERY
     except Exception as e:
-        logger.error(
+        logger.exception(
             "foursquare search failed",
             extra=build_log_extra(update, context, module_name="search", operation="do_foursquare_search"),
-            exc_info=True,
         )
         await update.message.reply_text(f"Error: {e}")
         return QUERY
 
 
-async def gpt_refine_intent(user_message: str) -> bool:
-    prompt = f"""
-    The user is interacting with a place search assistant. They just saw a list of results and were prompted to add more filters or say 'no' to finish. 
-    Classify the user's message as either:
-    - 'end' (if they want to stop, are satisfied, or say things like 'no', 'that's all', 'I'm done', 'stop', etc.)
-    - 'refine' (if they want to add more filters, change the search, or anything else)
-    Only reply with 'end' or 'refine'.
-    
-    User message: {user_message}
-    """
-    result = llm.chat(
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant that classifies user intent."},
-            {"role": "user", "content": prompt},
-        ],
-    ).lower()
-    return result == "end"
+# Telegram caps web_app_data at 4096 bytes; anything bigger is not from our web app.
+_WEB_APP_DATA_MAX_BYTES = 4096
 
 
 async def web_app_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    raw = update.effective_message.web_app_data.data
+    size = len(raw.encode())
+    if size > _WEB_APP_DATA_MAX_BYTES:
+        logger.warning(
+            "webapp payload too large",
+            extra=build_log_extra(update, context, module_name="webapp", operation="web_app_data", size=size),
+        )
+        await update.message.reply_text("Sorry, that submission is too large.", reply_markup=_REMOVE_KEYBOARD)
+        return
     try:
-        data = json.loads(update.effective_message.web_app_data.data)
+        place = WebAppPlacePayload.model_validate_json(raw)
         await update.message.reply_html(
             text=(
                 f"New place added successfully!\n\n"
-                f"Name: {data.get('name', 'N/A')}\n"
-                f"Category: {data.get('category', 'N/A')}\n"
-                f"Address: {data.get('address', 'N/A')}"
+                f"Name: {place.name}\n"
+                f"Category: {place.category}\n"
+                f"Address: {place.address}"
             ),
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         logger.info(
             "webapp data processed",
-            extra=build_log_extra(update, context, module_name="webapp", operation="web_app_data", fields_present=list(data.keys())),
+            extra=build_log_extra(update, context, module_name="webapp", operation="web_app_data", fields_present=sorted(place.model_fields_set)),
         )
-    except json.JSONDecodeError:
+    except ValidationError:
         await update.message.reply_text(
             "Sorry, there was an error processing the data.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     set_new_request_id(update, context)
     logger.info("/start received", extra=build_log_extra(update, context, module_name="conversation", operation="start"))
-    keyboard = [[KeyboardButton("Share Location 📍", request_location=True)]]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
     await update.message.reply_text(
         "Welcome to the Conversational Place Search Bot!\n\nPlease share your location to continue.",
-        reply_markup=reply_markup,
+        reply_markup=_START_KEYBOARD,
     )
     return LOCATION
 
@@ -688,7 +894,6 @@ async def location_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     )
 
     # Build map URL with user's lat/lon parameters
-    from urllib.parse import urlencode
     map_params = {
         'lat': user_location.latitude,
         'lon': user_location.longitude,
@@ -697,17 +902,13 @@ async def location_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     }
     map_url = f"https://staging.fused.io/server/v1/realtime-shared/fsh_gUEEDC5FXKza2P19Kpizm/run/file?{urlencode(map_params)}"
 
-    keyboard = [
-        [KeyboardButton("Search Foursquare data")],
-        [KeyboardButton("Add a new place")],
-        [KeyboardButton(
-            text="Explore the foursquare location data",
-            web_app=WebAppInfo(
-                url=map_url,
-            ),
-        )],
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = ReplyKeyboardMarkup(
+        (
+            *_LOCATION_MENU_STATIC_ROWS,
+            (KeyboardButton(text="Explore the foursquare location data", web_app=WebAppInfo(url=map_url)),),
+        ),
+        resize_keyboard=True,
+    )
     await update.message.reply_text(
         "Location received!\n"
         "What would you like to do?\n\n"
@@ -719,26 +920,130 @@ async def location_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     return LOCATION_CHOICE
 
 
-async def query_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    ensure_request_id(update, context)
-    user_query = update.message.text.strip()
-    logger.info("query received", extra=build_log_extra(update, context, module_name="search", operation="query_handler", user_query=user_query))
-    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+# Filler dropped when guessing the search keyword from a new query; mirrors
+# what parse_search_query_gpt is told to strip.
+_KEYWORD_STOPWORDS = frozenset({
+    "a", "an", "the", "some", "any", "i", "i'm", "im", "me", "my", "we", "us", "to", "for", "of",
+    "in", "at", "around", "near", "nearby", "close", "here", "by", "find", "show", "get", "want",
+    "looking", "look", "search", "need", "please", "can", "you", "where", "is", "are", "there",
+    "good", "great", "best", "nice", "place", "places", "joint", "joints", "spot", "spots",
+    "restaurant", "restaurants", "shop", "shops",
+})
+# Words that mean the parse will add filters, so a bare-keyword guess won't match.
+_KEYWORD_FILTER_CUES = frozenset({
+    "open", "now", "cheap", "expensive", "affordable", "price", "priced", "budget", "within",
+    "km", "kilometers", "mile", "miles", "meters", "m", "walking", "distance", "radius",
+})
+_KEYWORD_WORD_RE = re.compile(r"[a-z0-9']+")
+# Keywords clear enough to search without the LLM parse: Foursquare category
+# names with and without their generic suffix ("sushi restaurant" -> "sushi"),
+# plus common food searches that no category is named after.
+_GENERIC_CATEGORY_SUFFIX_RE = re.compile(r"\s+(?:restaurant|joint|shop|place|house|store)$")
+_LOCAL_QUERY_KEYWORDS = frozenset(_CATEGORY_KEY_LOWER_TO_ID) | frozenset(
+    _GENERIC_CATEGORY_SUFFIX_RE.sub("", name) for name in _CATEGORY_KEY_LOWER_TO_ID
+) | frozenset({
+    "pizza", "coffee", "tea", "brunch", "breakfast", "lunch", "dinner", "dessert", "ice cream",
+    "tacos", "pasta", "noodles", "dumplings", "bbq", "vegan", "vegetarian", "cocktails", "beer",
+})
+
+
+def _guess_search_keyword(text: str) -> Optional[str]:
+    """Cheap stand-in for the parsed ``query``, or None if the text looks like more than a keyword."""
+    words = [w for w in _KEYWORD_WORD_RE.findall(text.lower()) if w not in _KEYWORD_STOPWORDS]
+    if not words or len(words) > 2 or any(w in _KEYWORD_FILTER_CUES or w.isdigit() for w in words):
+        return None
+    return " ".join(words)
+
+
+async def _speculative_search(context: ContextTypes.DEFAULT_TYPE, user_query: str, current_params: Dict[str, Any]) -> None:
+    # Runs alongside parse_search_query_gpt to warm the search cache; when the
+    # parsed params match the guess, do_foursquare_search is served from it.
+    keyword = _guess_search_keyword(user_query)
+    location = context.user_data.get("location")
+    if not keyword or not isinstance(location, dict):
+        return
+    try:
+        lat = float(location.get("latitude"))
+        lng = float(location.get("longitude"))
+        request_params = _build_search_request_params({**current_params, "query": keyword})
+        await _search_places_cached(lat, lng, _SEARCH_FIELDS, request_params)
+    except Exception:
+        logger.debug("speculative foursquare search failed", exc_info=True)
+
+
+# Replies to the refine prompt that end the search without asking the LLM.
+_REFINE_END_PHRASES = frozenset({
+    "n", "no", "nope", "nah", "no thanks", "no thank you", "done", "i'm done", "im done",
+    "stop", "end", "quit", "exit", "cancel", "finish", "finished",
+    "that's all", "thats all", "that's it", "thats it",
+})
+_REFINE_END_PREFIXES = ("no thanks", "no thank", "that's enough", "thats enough")
+
+
+def _is_refine_end(text: str) -> bool:
+    normalized = text.lower().strip(" .!?")
+    return normalized in _REFINE_END_PHRASES or normalized.startswith(_REFINE_END_PREFIXES)
+
+
+# Per-turn outputs of parse_search_query_gpt; only the filters are kept in search_params.
+_SEARCH_TURN_FIELDS = {"search_now", "explanation", "end_search", "results_header", "refine_prompt"}
+
+
+async def _run_search_turn(update: Update, context: ContextTypes.DEFAULT_TYPE, user_query: str, allow_end: bool) -> int:
+    # One structured completion parses the filters, decides whether a refine
+    # reply ends the search, and writes the results header and refine prompt.
+    _send_typing(context, update.effective_chat.id)
+    if allow_end and _is_refine_end(user_query):
+        logger.info("refine done", extra=build_log_extra(update, context, module_name="search", operation="refine_handler", decision="end"))
+        await update.message.reply_text("Okay! If you want to start a new search, just type your query or /start.")
+        return ConversationHandler.END
 
     current_params = context.user_data.get('search_params', {})
-    gpt_result = await parse_search_query_gpt(user_query, current_params)
+    keyword = None if allow_end or current_params else _guess_search_keyword(user_query)
+    if keyword in _LOCAL_QUERY_KEYWORDS:
+        # A bare, well-known keyword on a fresh search: nothing for the LLM to
+        # merge or infer, so skip the round trip.
+        gpt_result = FoursquareSearchParams(query=keyword, explanation="Matched a known keyword locally")
+    elif allow_end:
+        gpt_result = await parse_search_query_gpt(user_query, current_params)
+    else:
+        gpt_result, _ = await asyncio.gather(
+            parse_search_query_gpt(user_query, current_params),
+            _speculative_search(context, user_query, current_params),
+        )
     # Log GPT parsed output for debugging
     try:
         logger.info("gpt parsed search params", extra=build_log_extra(update, context, module_name="search", operation="query_handler", gpt_parsed=gpt_result.model_dump()))
     except Exception:
         logger.info("gpt parsed search params", extra=build_log_extra(update, context, module_name="search", operation="query_handler"))
-    params = current_params.copy()
-    for k, v in gpt_result.model_dump().items():
-        if v is not None and v != "":
-            params[k] = v
+
+    if allow_end and gpt_result.end_search:
+        logger.info("refine done", extra=build_log_extra(update, context, module_name="search", operation="refine_handler", decision="end"))
+        await update.message.reply_text("Okay! If you want to start a new search, just type your query or /start.")
+        return ConversationHandler.END
+    if allow_end:
+        logger.info("refine continue", extra=build_log_extra(update, context, module_name="search", operation="refine_handler", decision="refine"))
+
+    updates = gpt_result.model_dump(exclude=_SEARCH_TURN_FIELDS, exclude_none=True, exclude_defaults=True)
+    if updates.get("query") == "":
+        del updates["query"]
+    params = current_params | updates
     context.user_data['search_params'] = params
     logger.info("search params updated", extra=build_log_extra(update, context, module_name="search", operation="query_handler", params=params))
-    return await do_foursquare_search(update, context, ask_refine=True)
+    return await do_foursquare_search(
+        update,
+        context,
+        ask_refine=True,
+        header=gpt_result.results_header,
+        refine_prompt=gpt_result.refine_prompt,
+    )
+
+
+async def query_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    ensure_request_id(update, context)
+    user_query = update.message.text.strip()
+    logger.info("query received", extra=build_log_extra(update, context, module_name="search", operation="query_handler", user_query=user_query))
+    return await _run_search_turn(update, context, user_query, allow_end=False)
 
 
 async def refine_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -751,32 +1056,39 @@ async def refine_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
     except Exception:
         logger.info("refine raw received", extra=build_log_extra(update, context, module_name="search", operation="refine_handler"))
-    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+    return await _run_search_turn(update, context, user_text, allow_end=True)
+
+
+_DRAFT_KEY = "draft"
 
-    if await gpt_refine_intent(user_text):
-        logger.info("refine done", extra=build_log_extra(update, context, module_name="search", operation="refine_handler", decision="end"))
-        await update.message.reply_text("Okay! If you want to start a new search, just type your query or /start.")
-        return ConversationHandler.END
-    else:
-        logger.info("refine continue", extra=build_log_extra(update, context, module_name="search", operation="refine_handler", decision="refine"))
-        return await query_handler(update, context)
+
+def _get_draft(context: ContextTypes.DEFAULT_TYPE) -> PlaceDraft:
+    draft = context.user_data.get(_DRAFT_KEY)
+    if isinstance(draft, PlaceDraft):
+        return draft
+    # Missing, or a plain dict after being reloaded from persistence.
+    draft = PlaceDraft(**draft) if isinstance(draft, dict) else PlaceDraft()
+    context.user_data[_DRAFT_KEY] = draft
+    return draft
 
 
 async def location_choice_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     ensure_request_id(update, context)
-    user_text = update.message.text.strip().lower()
+    user_text = _choice_text(update.message)
     logger.info("location menu choice", extra=build_log_extra(update, context, module_name="conversation", operation="location_choice_handler", choice=user_text))
 
-    if "search foursquare data" in user_text:
+    choice = _LOCATION_MENU_CHOICES.get(user_text)
+    if choice == QUERY:
         await update.message.reply_text(
             "Great! What are you looking for? (e.g. 'I'm craving sushi', 'Find a burger', etc.)",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return QUERY
-    elif "add a new place" in user_text:
+    elif choice == NAME:
+        context.user_data[_DRAFT_KEY] = PlaceDraft()
         await update.message.reply_text(
             "Great! First, what's the place called?",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return NAME
     else:
@@ -785,11 +1097,12 @@ async def location_choice_handler(update: Update, context: ContextTypes.DEFAULT_
 
 
 async def name_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    context.user_data['name'] = update.message.text.strip()
+    draft = _get_draft(context)
+    draft.name = update.message.text.strip()
     try:
         logger.info(
             "name received",
-            extra=build_log_extra(update, context, module_name="new_place", operation="name_handler", name=context.user_data['name']),
+            extra=build_log_extra(update, context, module_name="new_place", operation="name_handler", name=draft.name),
         )
     except Exception:
         logger.info("name received", extra=build_log_extra(update, context, module_name="new_place", operation="name_handler"))
@@ -800,7 +1113,7 @@ async def name_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     )
     await update.message.reply_text(
         prompt,
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=_REMOVE_KEYBOARD,
         parse_mode="HTML",
         disable_web_page_preview=True,
     )
@@ -816,16 +1129,17 @@ async def category_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         )
     except Exception:
         logger.info("category raw received", extra=build_log_extra(update, context, module_name="new_place", operation="category_handler"))
-    if text.lower().startswith("/skip") or text.lower() == "skip":
-        context.user_data['categories_ids'] = ""
-        context.user_data['categories_names'] = []
+    if _is_skip(text):
+        draft = _get_draft(context)
+        draft.categories_ids = ""
+        draft.categories_names = []
         await update.message.reply_text(
             "What's the address? Please paste the full address, including the country code.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return ADDRESS
 
-    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+    _send_typing(context, update.effective_chat.id)
     # Parse categories via GPT to normalized names from the allowed list
     try:
         parsed_names = await parse_categories_gpt(text, _CATEGORY_VALID_NAMES)
@@ -872,12 +1186,13 @@ async def category_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         )
         return CATEGORY
 
-    context.user_data['categories_ids'] = ",".join(mapped_ids)
-    context.user_data['categories_names'] = accepted_names
+    draft = _get_draft(context)
+    draft.categories_ids = ",".join(mapped_ids)
+    draft.categories_names = accepted_names
 
     await update.message.reply_text(
         "What's the address? Please paste the full address, including the country code.",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=_REMOVE_KEYBOARD,
     )
     return ADDRESS
 
@@ -891,15 +1206,14 @@ async def address_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
     except Exception:
         logger.info("address raw received", extra=build_log_extra(update, context, module_name="new_place", operation="address_handler"))
-    lowered = user_text.lower()
-    if not user_text or lowered.startswith("/skip") or lowered == "skip":
+    if not user_text or _is_skip(user_text):
         await update.message.reply_text(
             "An address is required to add a new place. Please provide the full address, including the country code.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return ADDRESS
 
-    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+    _send_typing(context, update.effective_chat.id)
     parsed = await parse_address_info_gpt(user_text)
     # Log GPT parsed output
     try:
@@ -909,10 +1223,11 @@ async def address_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if not parsed.is_valid:
         await update.message.reply_text(
             "Hmm, that didn't look like a valid address. Please try again with the full address, including the country code.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return ADDRESS
-    context.user_data['address_fields'] = {
+    draft = _get_draft(context)
+    draft.address_fields = {
         'address': parsed.address,
         'locality': parsed.locality,
         'region': parsed.region,
@@ -922,25 +1237,20 @@ async def address_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     try:
         logger.info(
             "address structured stored",
-            extra=build_log_extra(update, context, module_name="new_place", operation="address_handler", address_fields=context.user_data['address_fields']),
+            extra=build_log_extra(update, context, module_name="new_place", operation="address_handler", address_fields=draft.address_fields),
         )
     except Exception:
         logger.info("address structured stored", extra=build_log_extra(update, context, module_name="new_place", operation="address_handler"))
     # Ask for coordinates preference
-    keyboard = [
-        [KeyboardButton("Use my current location")],
-        [KeyboardButton("Enter coordinates")],
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
     await update.message.reply_text(
         "We also need the coordinates. Share your current location or enter latitude,longitude manually.",
-        reply_markup=reply_markup,
+        reply_markup=_COORDINATES_KEYBOARD,
     )
     return COORDINATES
 
 
 async def coordinates_choice_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    text = update.message.text.strip().lower()
+    text = _choice_text(update.message)
     try:
         logger.info(
             "coordinates choice received",
@@ -949,40 +1259,36 @@ async def coordinates_choice_handler(update: Update, context: ContextTypes.DEFAU
     except Exception:
         logger.info("coordinates choice received", extra=build_log_extra(update, context, module_name="new_place", operation="coordinates_choice_handler"))
 
-    if text in {"use my current location", "use my location"}:
+    choice = _COORDINATES_CHOICES.get(text)
+    if choice == "current":
         location = context.user_data.get('location', {})
         if not isinstance(location, dict) or location.get('latitude') is None or location.get('longitude') is None:
             await update.message.reply_text(
                 "I couldn't find your location. Please enter the coordinates manually (latitude,longitude).",
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=_REMOVE_KEYBOARD,
             )
             return COORDINATES_MANUAL
-        context.user_data['coordinates_source'] = 'current'
-        context.user_data['coordinates'] = {
+        draft = _get_draft(context)
+        draft.coordinates_source = 'current'
+        draft.coordinates = {
             'latitude': location.get('latitude'),
             'longitude': location.get('longitude'),
         }
         await update.message.reply_text(
             "Any contact or social links? Send anything (phone, website, email, Instagram...) or /skip.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return CONTACT
-    if text in {"enter coordinates", "enter coordinate", "enter"}:
+    if choice == "manual":
         await update.message.reply_text(
             "Please enter latitude,longitude (e.g., 12.9716,77.5946).",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return COORDINATES_MANUAL
-    if text in {"skip", "/skip"}:
+    if text in _SKIP_TOKENS:
         await update.message.reply_text(
             "Coordinates are required. Please share your current location or enter latitude,longitude manually.",
-            reply_markup=ReplyKeyboardMarkup(
-                [
-                    [KeyboardButton("Use my current location")],
-                    [KeyboardButton("Enter coordinates")],
-                ],
-                resize_keyboard=True,
-            ),
+            reply_markup=_COORDINATES_KEYBOARD,
         )
         return COORDINATES
 
@@ -999,20 +1305,13 @@ async def coordinates_manual_handler(update: Update, context: ContextTypes.DEFAU
         )
     except Exception:
         logger.info("coordinates raw received", extra=build_log_extra(update, context, module_name="new_place", operation="coordinates_manual_handler"))
-    if user_text.lower() in {"/skip", "skip"}:
-        choice_keyboard = ReplyKeyboardMarkup(
-            [
-                [KeyboardButton("Use my current location")],
-                [KeyboardButton("Enter coordinates")],
-            ],
-            resize_keyboard=True,
-        )
+    if _is_skip(user_text):
         await update.message.reply_text(
             "Coordinates are required. Share your current location or enter latitude,longitude manually.",
-            reply_markup=choice_keyboard,
+            reply_markup=_COORDINATES_KEYBOARD,
         )
         return COORDINATES
-    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+    _send_typing(context, update.effective_chat.id)
     parsed = await parse_coordinates_gpt(user_text)
     try:
         logger.info(
@@ -1026,16 +1325,9 @@ async def coordinates_manual_handler(update: Update, context: ContextTypes.DEFAU
     lat = parsed.get("latitude")
     lng = parsed.get("longitude")
     if not is_valid or lat is None or lng is None:
-        choice_keyboard = ReplyKeyboardMarkup(
-            [
-                [KeyboardButton("Use my current location")],
-                [KeyboardButton("Enter coordinates")],
-            ],
-            resize_keyboard=True,
-        )
         await update.message.reply_text(
             "Couldn't parse coordinates. Choose an option below or try entering them again as latitude,longitude (e.g., 12.9716,77.5946).",
-            reply_markup=choice_keyboard,
+            reply_markup=_COORDINATES_KEYBOARD,
         )
         return COORDINATES
     try:
@@ -1044,28 +1336,85 @@ async def coordinates_manual_handler(update: Update, context: ContextTypes.DEFAU
         if not (-90.0 <= lat_f <= 90.0 and -180.0 <= lng_f <= 180.0):
             raise ValueError("out of range")
     except Exception:
-        choice_keyboard = ReplyKeyboardMarkup(
-            [
-                [KeyboardButton("Use my current location")],
-                [KeyboardButton("Enter coordinates")],
-            ],
-            resize_keyboard=True,
-        )
         await update.message.reply_text(
             "Coordinates out of range. Choose an option below or try entering them again.",
-            reply_markup=choice_keyboard,
+            reply_markup=_COORDINATES_KEYBOARD,
         )
         return COORDINATES
 
-    context.user_data['coordinates_source'] = 'manual'
-    context.user_data['coordinates'] = {'latitude': lat_f, 'longitude': lng_f}
+    draft = _get_draft(context)
+    draft.coordinates_source = 'manual'
+    draft.coordinates = {'latitude': lat_f, 'longitude': lng_f}
     await update.message.reply_text(
         "Any contact or social links? Send anything (phone, website, email, Instagram...) or /skip.",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=_REMOVE_KEYBOARD,
     )
     return CONTACT
 
 
+# "phone,website,email" in that order: the format the original bot asked for.
+_CONTACT_SEPARATOR_RE = re.compile(r"\s*[,;]\s*")
+# Checked in order; email goes first since an address also looks like a domain.
+_CONTACT_FIELD_RES = (
+    ("email", re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")),
+    ("website", re.compile(r"(?:https?://)?(?:www\.)?[\w-]+(?:\.[\w-]+)*\.[a-z]{2,}(?:[/?#]\S*)?", re.IGNORECASE)),
+    ("phone", re.compile(r"\+?\d[\d\s().-]{7,}\d")),
+)
+# A bare "word.word" is too loose to call a website (e.g. "open.now"); without a
+# scheme or "www." the host must end in one of these common TLDs.
+_WEBSITE_PREFIX_RE = re.compile(r"(?:https?://|www\.)", re.IGNORECASE)
+_WEBSITE_HOST_TLD_RE = re.compile(r"[^/?#]*\.([a-z]{2,})(?:[/?#]|$)", re.IGNORECASE)
+_KNOWN_TLDS = frozenset({
+    "com", "org", "net", "io", "co", "ai", "app", "dev", "biz", "info", "shop", "store",
+    "cafe", "restaurant", "us", "uk", "in", "de", "fr", "es", "it", "nl", "eu", "ca",
+    "au", "jp", "br", "mx", "sg", "ae",
+})
+# Social profile links belong in facebookUrl/instagram/twitter; leave them to the LLM.
+_SOCIAL_DOMAIN_RE = re.compile(r"(?:^|[/.])(?:facebook|fb|instagram|twitter|x)\.com\b", re.IGNORECASE)
+
+
+def _is_plain_website(part: str) -> bool:
+    """True for a non-social URL with a scheme, "www." or a known TLD."""
+    if _SOCIAL_DOMAIN_RE.search(part):
+        return False
+    if _WEBSITE_PREFIX_RE.match(part):
+        return True
+    host = _WEBSITE_HOST_TLD_RE.match(part)
+    return bool(host) and host.group(1).lower() in _KNOWN_TLDS
+
+
+def _parse_contact_fields(user_input: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse comma/semicolon separated phone, website and email without an LLM call.
+
+    Each part must match exactly one field, and no field may repeat. Anything
+    else (social handles, free text, two phone numbers) returns None so the
+    caller falls back to ``parse_contact_info_gpt``.
+    """
+    result: Dict[str, Any] = {
+        "is_valid": True,
+        "phone": "",
+        "website": "",
+        "email": "",
+        "facebookUrl": "",
+        "instagram": "",
+        "twitter": "",
+    }
+    parts = [part for part in _CONTACT_SEPARATOR_RE.split(user_input.strip()) if part]
+    if not parts:
+        return None
+    for part in parts:
+        for field, pattern in _CONTACT_FIELD_RES:
+            if pattern.fullmatch(part):
+                break
+        else:
+            return None
+        if result[field] or (field == "website" and not _is_plain_website(part)):
+            return None
+        result[field] = part
+    return result
+
+
 async def contact_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     user_text = update.message.text.strip()
     try:
@@ -1075,11 +1424,14 @@ async def contact_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
     except Exception:
         logger.info("contact raw received", extra=build_log_extra(update, context, module_name="new_place", operation="contact_handler"))
-    if user_text.lower() in {"skip", "/skip"}:
-        context.user_data["contact"] = {}
+    draft = _get_draft(context)
+    if _is_skip(user_text):
+        draft.contact = {}
     else:
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
-        result = await parse_contact_info_gpt(user_text)
+        result = _parse_contact_fields(user_text)
+        if result is None:
+            _send_typing(context, update.effective_chat.id)
+            result = await parse_contact_info_gpt(user_text)
         # Log GPT parsed output
         try:
             logger.info("gpt parsed contact", extra=build_log_extra(update, context, module_name="new_place", operation="contact_handler", gpt_parsed=result))
@@ -1090,7 +1442,7 @@ async def contact_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 "Couldn't parse that. Try again or /skip."
             )
             return CONTACT
-        context.user_data["contact"] = {
+        draft.contact = {
             "phone": result.get("phone", ""),
             "website": result.get("website", ""),
             "email": result.get("email", ""),
@@ -1101,18 +1453,16 @@ async def contact_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         try:
             logger.info(
                 "contact structured stored",
-                extra=build_log_extra(update, context, module_name="new_place", operation="contact_handler", contact=context.user_data["contact"]),
+                extra=build_log_extra(update, context, module_name="new_place", operation="contact_handler", contact=draft.contact),
             )
         except Exception:
             logger.info("contact structured stored", extra=build_log_extra(update, context, module_name="new_place", operation="contact_handler"))
-    keyboard = [[KeyboardButton("Open 24/7")], [KeyboardButton("Custom Hours")]]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-    await update.message.reply_text("What are the hours?", reply_markup=reply_markup)
+    await update.message.reply_text("What are the hours?", reply_markup=_HOURS_KEYBOARD)
     return HOURS
 
 
 async def hours_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    user_choice = update.message.text.strip().lower()
+    user_choice = _choice_text(update.message)
     try:
         logger.info(
             "hours choice received",
@@ -1120,30 +1470,136 @@ async def hours_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         )
     except Exception:
         logger.info("hours choice received", extra=build_log_extra(update, context, module_name="new_place", operation="hours_handler"))
-    if user_choice.startswith("/skip") or user_choice == "skip":
-        context.user_data["hours_api"] = ""
+    draft = _get_draft(context)
+    if user_choice in _SKIP_TOKENS:
+        draft.hours_api = ""
         # Skip chains, go directly to attributes
-        reply_markup = _build_attributes_keyboard()
         await update.message.reply_text(
             "Pick any attributes (tap Done when finished).",
-            reply_markup=reply_markup,
+            reply_markup=_ATTRIBUTES_KEYBOARD,
         )
         return ATTRIBUTES
-    if "open 24/7" in user_choice:
-        hours_247 = ";".join([f"{day},0000,2400" for day in range(1, 8)])
-        context.user_data["hours_api"] = hours_247
-        reply_markup = _build_attributes_keyboard()
+    if user_choice not in _HOURS_CHOICES:
         await update.message.reply_text(
-            "Pick any attributes (tap Done when finished).",
-            reply_markup=reply_markup,
+            "Please choose Open 24/7 or Custom Hours, or /skip.",
+            reply_markup=_HOURS_KEYBOARD,
         )
-        return ATTRIBUTES
-    elif "custom hours" in user_choice:
+        return HOURS
+    hours = _HOURS_CHOICES[user_choice]
+    if hours is None:
         await update.message.reply_text(
             "Type the hours in your own words (e.g. Mon-Fri 9am-6pm).",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return CUSTOM_HOURS
+    draft.hours_api = hours
+    await update.message.reply_text(
+        "Pick any attributes (tap Done when finished).",
+        reply_markup=_ATTRIBUTES_KEYBOARD,
+    )
+    return ATTRIBUTES
+
+
+_DAY_NUMBERS: Dict[str, int] = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("mon", "monday"),
+            ("tue", "tues", "tuesday"),
+            ("wed", "weds", "wednesday"),
+            ("thu", "thur", "thurs", "thursday"),
+            ("fri", "friday"),
+            ("sat", "saturday"),
+            ("sun", "sunday"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+_EVERY_DAY_WORDS = frozenset({"daily", "everyday", "every day", "mon-sun", "monday-sunday"})
+_HOURS_SEGMENT_SPLIT_RE = re.compile(r"\s*[;,]\s*")
+_DAY_RANGE_SPLIT_RE = re.compile(r"\s*(?:-|to)\s*")
+_HOURS_SEGMENT_RE = re.compile(
+    r"(?P<days>[a-z]+(?:\s*(?:-|to)\s*[a-z]+)?|every day)\s*:?\s*"
+    r"(?P<start>\d{1,2}(?::\d{2})?\s*(?:am|pm)?)\s*(?:-|to)\s*"
+    r"(?P<end>\d{1,2}(?::\d{2})?\s*(?:am|pm)?)"
+)
+_HOURS_TIME_RE = re.compile(r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<meridiem>am|pm)?")
+
+
+def _parse_hours_days(text: str) -> Optional[list[int]]:
+    if text in _EVERY_DAY_WORDS:
+        return list(range(1, 8))
+    parts = _DAY_RANGE_SPLIT_RE.split(text, maxsplit=1)
+    start = _DAY_NUMBERS.get(parts[0])
+    if start is None:
+        return None
+    if len(parts) == 1:
+        return [start]
+    end = _DAY_NUMBERS.get(parts[1])
+    if end is None:
+        return None
+    # Ranges may wrap the week, e.g. Sat-Mon.
+    return [(start - 1 + offset) % 7 + 1 for offset in range((end - start) % 7 + 1)]
+
+
+def _parse_hours_time(text: str, meridiem_hint: Optional[str]) -> Optional[tuple[int, int, Optional[str]]]:
+    match = _HOURS_TIME_RE.fullmatch(text)
+    if match is None:
+        return None
+    hour = int(match["hour"])
+    minute = int(match["minute"] or 0)
+    meridiem = match["meridiem"] or meridiem_hint
+    if meridiem is None:
+        # Bare hours like "9-6" are ambiguous; only accept 24-hour HH:MM.
+        if match["minute"] is None or hour > 23:
+            return None
+    elif not 1 <= hour <= 12:
+        return None
+    else:
+        hour = hour % 12 + (12 if meridiem == "pm" else 0)
+    if minute > 59:
+        return None
+    return hour, minute, match["meridiem"]
+
+
+def _parse_hours_fast(user_input: str) -> Optional[str]:
+    """
+    Convert common "Mon-Fri 9am-6pm; Sat 10:00-14:00" style hours to the
+    Foursquare hours string without an LLM call.
+
+    Returns None for anything outside this simple grammar (bare "9-6",
+    labels, holidays...) so the caller falls back to ``parse_hours_to_api_gpt``.
+    """
+    entries: list[tuple[int, str]] = []
+    for segment in _HOURS_SEGMENT_SPLIT_RE.split(user_input.strip().lower()):
+        match = _HOURS_SEGMENT_RE.fullmatch(segment)
+        if match is None:
+            return None
+        days = _parse_hours_days(match["days"])
+        end = _parse_hours_time(match["end"], None)
+        if days is None or end is None:
+            return None
+        # "9-6pm" carries its meridiem on the end time only.
+        start = _parse_hours_time(match["start"], end[2])
+        if start is None:
+            return None
+        start_hhmm = start[0] * 100 + start[1]
+        end_hhmm = end[0] * 100 + end[1]
+        if start[2] is None and end[2] is not None and start_hhmm >= end_hhmm:
+            # "9-5pm" or "10-2am": the borrowed meridiem doesn't fit; let the LLM decide.
+            return None
+        if end_hhmm == 0:
+            end_str = "2400"
+        elif end_hhmm <= start_hhmm:
+            end_str = f"+{end_hhmm:04d}"
+        else:
+            end_str = f"{end_hhmm:04d}"
+        entries.extend((day, f"{day},{start_hhmm:04d},{end_str}") for day in days)
+    if not entries:
+        return None
+    entries.sort(key=lambda entry: entry[0])
+    return ";".join(entry for _, entry in entries)
 
 
 async def custom_hours_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -1155,11 +1611,16 @@ async def custom_hours_handler(update: Update, context: ContextTypes.DEFAULT_TYP
         )
     except Exception:
         logger.info("custom hours raw received", extra=build_log_extra(update, context, module_name="new_place", operation="custom_hours_handler"))
-    if user_text.lower() in {"/skip", "skip"}:
-        context.user_data["hours_api"] = ""
+    draft = _get_draft(context)
+    if _is_skip(user_text):
+        draft.hours_api = ""
     else:
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
-        parsed = await parse_hours_to_api_gpt(user_text)
+        fast_hours = _parse_hours_fast(user_text)
+        if fast_hours is not None:
+            parsed = {"is_valid": True, "hours": fast_hours, "explanation": ""}
+        else:
+            _send_typing(context, update.effective_chat.id)
+            parsed = await parse_hours_to_api_gpt(user_text)
         # Log GPT parsed output
         try:
             logger.info("gpt parsed hours", extra=build_log_extra(update, context, module_name="new_place", operation="custom_hours_handler", gpt_parsed=parsed))
@@ -1170,31 +1631,45 @@ async def custom_hours_handler(update: Update, context: ContextTypes.DEFAULT_TYP
                 "Couldn't parse those hours. Try again, or /skip."
             )
             return CUSTOM_HOURS
-        context.user_data["hours_api"] = parsed["hours"]
+        draft.hours_api = parsed["hours"]
     # Skip chains, go directly to attributes
-    reply_markup = _build_attributes_keyboard()
-    await update.message.reply_text("Pick any attributes (tap Done when finished).", reply_markup=reply_markup)
+    await update.message.reply_text("Pick any attributes (tap Done when finished).", reply_markup=_ATTRIBUTES_KEYBOARD)
     return ATTRIBUTES 
 
 
-async def chain_status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+# Telegram redelivers a callback_query when the webhook is slow or fails;
+# remember recently handled ids so side effects run once.
+_SEEN_CALLBACK_QUERIES: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+
+async def _is_duplicate_callback_query(context: ContextTypes.DEFAULT_TYPE, query_id: str) -> bool:
+    if query_id in _SEEN_CALLBACK_QUERIES:
+        return True
+    _SEEN_CALLBACK_QUERIES[query_id] = True
+    persistence = context.application.persistence
+    if isinstance(persistence, RedisPersistence):
+        return not await persistence.claim_callback_query(query_id)
+    return False
+
+
+async def chain_status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Optional[int]:
     # Deprecated: chains flow is skipped
     query = update.callback_query
     await query.answer()
-    reply_markup = _build_attributes_keyboard()
+    if await _is_duplicate_callback_query(context, query.id):
+        return None
     await query.message.reply_text(
         "Pick any attributes (tap Done when finished).",
-        reply_markup=reply_markup,
+        reply_markup=_ATTRIBUTES_KEYBOARD,
     )
     return ATTRIBUTES
 
 
 async def chain_details_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     # Deprecated: chains flow is skipped
-    reply_markup = _build_attributes_keyboard()
     await update.message.reply_text(
         "Pick any attributes (tap Done when finished).",
-        reply_markup=reply_markup,
+        reply_markup=_ATTRIBUTES_KEYBOARD,
     )
     return ATTRIBUTES
 
@@ -1212,13 +1687,14 @@ _ATTR_MAP = {
 
 
 async def attributes_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    draft = _get_draft(context)
     if update.message.text == "Done ✅":
         tokens = []
-        for label in context.user_data.get('attributes', []):
+        for label in draft.attributes:
             mapped = _ATTR_MAP.get(label)
             if mapped:
                 tokens.append(mapped)
-        context.user_data['attributes_tokens'] = tokens
+        draft.attributes_tokens = tokens
         try:
             logger.info(
                 "attributes finalized",
@@ -1226,14 +1702,20 @@ async def attributes_handler(update: Update, context: ContextTypes.DEFAULT_TYPE)
             )
         except Exception:
             logger.info("attributes finalized", extra=build_log_extra(update, context, module_name="new_place", operation="attributes_handler"))
-        keyboard = [[KeyboardButton("Yes"), KeyboardButton("No")]]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        await update.message.reply_text("Is it a private place? (Yes/No) or /skip", reply_markup=reply_markup)
+        await update.message.reply_text("Is it a private place? (Yes/No) or /skip", reply_markup=_PRIVATE_PLACE_KEYBOARD)
         return PRIVATE_PLACE
 
-    if 'attributes' not in context.user_data:
-        context.user_data['attributes'] = []
-    context.user_data['attributes'].append(update.message.text)
+    # Insertion-ordered set; tapping a selected attribute again deselects it.
+    label = update.message.text
+    if label in draft.attributes:
+        del draft.attributes[label]
+        logger.info(
+            "attribute deselected",
+            extra=build_log_extra(update, context, module_name="new_place", operation="attributes_handler", selected_label=label),
+        )
+        await update.message.reply_text(f"Removed {label}. Tap it again to re-add it.")
+        return ATTRIBUTES
+    draft.attributes[label] = None
     try:
         logger.info(
             "attribute selected",
@@ -1245,7 +1727,7 @@ async def attributes_handler(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 
 async def private_place_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    text = update.message.text.strip().lower()
+    text = _choice_text(update.message)
     try:
         logger.info(
             "private place input",
@@ -1253,12 +1735,11 @@ async def private_place_handler(update: Update, context: ContextTypes.DEFAULT_TY
         )
     except Exception:
         logger.info("private place input", extra=build_log_extra(update, context, module_name="new_place", operation="private_place_handler"))
-    if text in {"/skip", "skip"}:
-        context.user_data['is_private'] = None
-    elif text in {"yes", "y"}:
-        context.user_data['is_private'] = True
-    elif text in {"no", "n"}:
-        context.user_data['is_private'] = False
+    draft = _get_draft(context)
+    if text in _SKIP_TOKENS:
+        draft.is_private = None
+    elif text in _PRIVATE_PLACE_CHOICES:
+        draft.is_private = _PRIVATE_PLACE_CHOICES[text]
     else:
         await update.message.reply_text("Please reply Yes, No, or /skip.")
         return PRIVATE_PLACE
@@ -1266,27 +1747,32 @@ async def private_place_handler(update: Update, context: ContextTypes.DEFAULT_TY
 
 
 async def photos_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if 'photos' not in context.user_data:
-        context.user_data['photos'] = []
+    photos = _get_draft(context).photos
 
     if update.message.photo:
-        context.user_data['photos'].append(update.message.photo[-1].file_id)
+        photo = update.message.photo[-1]
+        if photo.file_unique_id in photos:
+            await update.message.reply_text("You've already sent that photo. Send another or type /done when finished.")
+            return PHOTOS
+        # Keep the size with the draft so the summary survives restarts and
+        # persistence reloads.
+        photos[photo.file_unique_id] = {"file_id": photo.file_id, "file_size": photo.file_size}
         try:
             logger.info(
                 "photo received",
-                extra=build_log_extra(update, context, module_name="new_place", operation="photos_handler", count=len(context.user_data['photos'])),
+                extra=build_log_extra(update, context, module_name="new_place", operation="photos_handler", count=len(photos), width=photo.width, height=photo.height, file_size=photo.file_size),
             )
         except Exception:
             logger.info("photo received", extra=build_log_extra(update, context, module_name="new_place", operation="photos_handler"))
-        if len(context.user_data['photos']) >= 3:
+        if len(photos) >= 3:
             return await confirm_data(update, context)
         await update.message.reply_text(
-            f"Photo {len(context.user_data['photos'])} received! "
+            f"Photo {len(photos)} received! "
             "Send another or type /done when finished."
         )
         return PHOTOS
 
-    if update.message.text == "/skip" or update.message.text == "/done":
+    if update.message.text in _SKIP_OR_DONE_COMMANDS:
         try:
             logger.info(
                 "photos stage skipped or done",
@@ -1299,84 +1785,117 @@ async def photos_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     return PHOTOS
 
 
+_CONTACT_SUMMARY_KEYS: tuple[str, ...] = ('phone', 'website', 'email', 'instagram', 'facebookUrl', 'twitter')
+_PRIVATE_SUMMARY_LABELS: tuple[str, str] = ("Private: No", "Private: Yes")
+# Bound format methods for the summary lines; address_handler always fills all
+# five address keys, so the template can index them directly.
+_SUMMARY_ADDRESS_FORMAT = "Address: {address}, {locality} {region} {postcode} {country_code}".format_map
+_SUMMARY_PHOTOS_FORMAT = "Photos: {} attached ({} KB)".format
+
+
 async def confirm_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    data = context.user_data
-    address_fields = data.get('address_fields', {})
-    contact = data.get('contact', {})
-    attributes_tokens = data.get('attributes_tokens', [])
+    draft = _get_draft(context)
+    address_fields = draft.address_fields
+    contact = draft.contact
+    attributes_tokens = draft.attributes_tokens
 
     try:
         logger.info(
             "confirm summary generated",
-            extra=build_log_extra(update, context, module_name="new_place", operation="confirm_data", name=data.get('name', ''), categories=data.get('categories_names', []), has_hours=bool(data.get('hours_api')), is_private=data.get('is_private')),
+            extra=build_log_extra(update, context, module_name="new_place", operation="confirm_data", name=draft.name, categories=draft.categories_names, has_hours=bool(draft.hours_api), is_private=draft.is_private),
         )
     except Exception:
         logger.info("confirm summary generated", extra=build_log_extra(update, context, module_name="new_place", operation="confirm_data"))
 
-    lines = [
-        "📍 Place Summary:",
-        f"Name: {data.get('name', '')}",
-    ]
-    if data.get('categories_names'):
-        lines.append("Categories: " + ", ".join(data.get('categories_names')))
+    categories_names = draft.categories_names
+    is_private = draft.is_private
+    photos = draft.photos
+
+    lines = ["📍 Place Summary:", f"Name: {draft.name}"]
+    if categories_names:
+        lines.append("Categories: " + ", ".join(categories_names))
     if address_fields:
-        lines.append(
-            f"Address: {address_fields.get('address', '')}, {address_fields.get('locality', '')} {address_fields.get('region', '')} {address_fields.get('postcode', '')} {address_fields.get('country_code', '')}".strip()
-        )
+        lines.append(_SUMMARY_ADDRESS_FORMAT(address_fields).strip())
     if contact:
-        c_bits = [
-            contact.get('phone', ''),
-            contact.get('website', ''),
-            contact.get('email', ''),
-            contact.get('instagram', ''),
-            contact.get('facebookUrl', ''),
-            contact.get('twitter', ''),
-        ]
-        lines.append("Contact: " + ", ".join([b for b in c_bits if b]))
-    if data.get('hours_api'):
+        lines.append("Contact: " + ", ".join(filter(None, (contact.get(k, '') for k in _CONTACT_SUMMARY_KEYS))))
+    if draft.hours_api:
         lines.append("Hours: set")
     if attributes_tokens:
         lines.append("Attributes: " + ", ".join(attributes_tokens))
-    if data.get('is_private') is not None:
-        lines.append("Private: Yes" if data.get('is_private') else "Private: No")
-
-    confirmation_text = "\n".join(lines + ["", "Is this information correct?"])
-    keyboard = [[InlineKeyboardButton("Yes, Submit ✅", callback_data="confirm_yes"), InlineKeyboardButton("No, Edit ✏️", callback_data="confirm_no")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await update.message.reply_text(confirmation_text, reply_markup=reply_markup)
+    if is_private is not None:
+        lines.append(_PRIVATE_SUMMARY_LABELS[bool(is_private)])
+    if photos:
+        total_bytes = sum(photo.get("file_size") or 0 for photo in photos.values())
+        lines.append(_SUMMARY_PHOTOS_FORMAT(len(photos), total_bytes // 1024) if total_bytes else f"Photos: {len(photos)} attached")
+    lines.append("")
+    lines.append("Is this information correct?")
+
+    confirmation_text = "\n".join(lines)
+    await update.message.reply_text(confirmation_text, reply_markup=_CONFIRM_KEYBOARD)
     return CONFIRM
 
 
-async def handle_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+async def _submit_place_suggestion(bot: Bot, chat_id: int, params: Dict[str, Any], log_extra: Dict[str, Any]) -> None:
+    try:
+        resp = await fsq.suggest_place(params)
+        try:
+            logger.info("suggest place success", extra={**log_extra, "response": resp})
+        except Exception:
+            logger.info("suggest place success", extra=log_extra)
+        await bot.send_message(
+            chat_id=chat_id,
+            text="Your request for a new place has been accepted successfully!\n\nStart a new conversation by typing\n/start",
+            reply_markup=_REMOVE_KEYBOARD,
+        )
+    except Exception as e:
+        # Log the server response body if the API rejected the request
+        response_text = e.response_text if isinstance(e, FoursquareAPIError) else ""
+        logger.error(
+            "suggest place failed",
+            extra={**log_extra, "error": str(e), "response_text": response_text},
+            exc_info=True,
+        )
+        msg = "Your request for a new place could not be processed. Please try again later."
+        await bot.send_message(
+            chat_id=chat_id,
+            text=msg,
+            reply_markup=_REMOVE_KEYBOARD,
+        )
+
+
+async def handle_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Optional[int]:
     query = update.callback_query
     await query.answer()
+    if await _is_duplicate_callback_query(context, query.id):
+        logger.info("duplicate callback query ignored", extra=build_log_extra(update, context, module_name="new_place", operation="handle_confirmation"))
+        return None
     if query.data == "confirm_yes":
         # Build params for suggest endpoint
-        data = context.user_data
-        address_fields = data.get('address_fields', {})
-        contact = data.get('contact', {})
+        draft = _get_draft(context)
+        address_fields = draft.address_fields
+        contact = draft.contact
 
         params: Dict[str, Any] = {}
-        params['name'] = data.get('name', '')
-        if data.get('categories_ids'):
-            params['categories'] = data.get('categories_ids')
+        params['name'] = draft.name
+        if draft.categories_ids:
+            params['categories'] = draft.categories_ids
         if address_fields:
             for key in ['address', 'locality', 'region', 'postcode', 'country_code']:
                 if address_fields.get(key):
                     params[key] = address_fields.get(key)
         # Coordinates: only include if user opted in
-        coords_src = data.get('coordinates_source')
-        if coords_src == 'manual' and isinstance(data.get('coordinates'), dict):
-            params['latitude'] = data['coordinates'].get('latitude')
-            params['longitude'] = data['coordinates'].get('longitude')
+        coords_src = draft.coordinates_source
+        if coords_src == 'manual' and isinstance(draft.coordinates, dict):
+            params['latitude'] = draft.coordinates.get('latitude')
+            params['longitude'] = draft.coordinates.get('longitude')
         elif coords_src == 'current':
             lat = context.user_data.get('location', {}).get('latitude')
             lng = context.user_data.get('location', {}).get('longitude')
             if lat is not None and lng is not None:
                 params['latitude'] = lat
                 params['longitude'] = lng
-        if data.get('is_private') is not None:
-            params['isPrivatePlace'] = data.get('is_private')
+        if draft.is_private is not None:
+            params['isPrivatePlace'] = draft.is_private
         if contact:
             if contact.get('phone'):
                 params['tel'] = contact.get('phone')
@@ -1390,48 +1909,25 @@ async def handle_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE
                 params['instagram'] = contact.get('instagram')
             if contact.get('twitter'):
                 params['twitter'] = contact.get('twitter')
-        if data.get('hours_api'):
-            params['hours'] = data.get('hours_api')
-        if data.get('attributes_tokens'):
-            params['attributes'] = ",".join(data.get('attributes_tokens'))
+        if draft.hours_api:
+            params['hours'] = draft.hours_api
+        if draft.attributes_tokens:
+            params['attributes'] = ",".join(draft.attributes_tokens)
         params['dry_run'] = False
 
         safe_params = _sanitize_suggest_params(params)
         logger.info("suggest params (sanitized)", extra=build_log_extra(update, context, module_name="new_place", operation="handle_confirmation", suggest_params=safe_params))
 
-        try:
-            await context.bot.send_chat_action(chat_id=query.message.chat.id, action=ChatAction.TYPING)
-            resp = fsq.suggest_place(safe_params)
-            try:
-                logger.info(
-                    "suggest place success",
-                    extra=build_log_extra(update, context, module_name="new_place", operation="handle_confirmation", response=resp),
-                )
-            except Exception:
-                logger.info("suggest place success", extra=build_log_extra(update, context, module_name="new_place", operation="handle_confirmation"))
-            await query.message.reply_text(
-                "Your request for a new place has been accepted successfully!\n\nStart a new conversation by typing\n/start",
-                reply_markup=ReplyKeyboardRemove(),
-            )
-        except Exception as e:
-            # Try to log server response if available
-            response_text = ""
-            try:
-                import requests
-                if isinstance(e, requests.HTTPError) and e.response is not None:
-                    response_text = e.response.text
-            except Exception:
-                pass
-            logger.error(
-                "suggest place failed",
-                extra=build_log_extra(update, context, module_name="new_place", operation="handle_confirmation", error=str(e), response_text=response_text),
-                exc_info=True,
-            )
-            msg = "Your request for a new place could not be processed. Please try again later."
-            await query.message.reply_text(
-                msg,
-                reply_markup=ReplyKeyboardRemove(),
-            )
+        _send_typing(context, query.message.chat.id)
+        # Submit in the background so the handler returns without waiting on
+        # the Foursquare round-trip; the task reports the outcome to the user.
+        log_extra = build_log_extra(update, context, module_name="new_place", operation="handle_confirmation")
+        context.application.create_task(
+            _submit_place_suggestion(context.bot, query.message.chat.id, safe_params, log_extra),
+            update=update,
+        )
+        # The task works from its own params snapshot; drop the per-user state.
+        context.user_data.clear()
         return ConversationHandler.END
     else:
         try:
@@ -1441,13 +1937,20 @@ async def handle_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE
             )
         except Exception:
             logger.info("confirmation denied by user", extra=build_log_extra(update, context, module_name="new_place", operation="handle_confirmation"))
-        await query.message.reply_text(
-            "Okay, let's start over. Please type /start again",
-            reply_markup=ReplyKeyboardRemove(),
-        )
+        # Edit the summary in place: drops its stale inline buttons without
+        # sending another message.
+        context.user_data.clear()
+        await query.edit_message_text("Okay, let's start over. Please type /start again")
         return ConversationHandler.END
 
 
+async def busy_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    # ConversationHandler.WAITING: a non-blocking handler (LLM parse, search)
+    # is still running for this user, so the update can't advance the flow.
+    logger.info("update received while busy", extra=build_log_extra(update, context, module_name="conversation", operation="busy_handler"))
+    await update.effective_message.reply_text("Still working on your last message, one moment...")
+
+
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     try:
         logger.info(
@@ -1456,8 +1959,9 @@ async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         )
     except Exception:
         logger.info("conversation cancelled by user", extra=build_log_extra(update, context, module_name="conversation", operation="cancel"))
+    context.user_data.clear()
     await update.message.reply_text(
         "Operation cancelled. Type /start to begin again.",
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=_REMOVE_KEYBOARD,
     )
     return ConversationHandler.END 
\ No newline at end of file
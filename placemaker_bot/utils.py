@@ -1,7 +1,11 @@
+import secrets
+import threading
 import time
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 import requests
+from cachetools import TTLCache
 
 from .config import settings
 
@@ -29,7 +33,7 @@ def discover_external_base_url(max_wait_seconds: int = 60) -> str:
         try:
             resp = requests.get(api_url, timeout=3)
             if resp.ok:
-                public_url = _extract_https_url(resp.json())
+                public_url = _extract_https_url(orjson.loads(resp.content))
                 if public_url:
                     return public_url
         except Exception:
@@ -61,4 +65,25 @@ def _extract_https_url(payload: dict[str, object]) -> Optional[str]:
             public_url = entry.get("public_url")
             if proto == "https" and isinstance(public_url, str) and public_url.startswith("https://"):
                 return public_url
-    return None
\ No newline at end of file
+    return None
+
+
+# Search results shown in the list-view web app, keyed by a short random id so
+# the inline button carries "?id=..." instead of the whole payload. Written
+# from the bot's event loop and read from Flask's thread, hence the lock. Only
+# used by a single process: with REDIS_URL set the bot uses "?data=" instead.
+_WEBAPP_RESULTS: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_WEBAPP_RESULTS_LOCK = threading.Lock()
+
+
+def stash_webapp_results(results: list[dict[str, Any]]) -> str:
+    """Store ``results`` for the web app and return the id to put in its URL."""
+    results_id = secrets.token_urlsafe(8)
+    with _WEBAPP_RESULTS_LOCK:
+        _WEBAPP_RESULTS[results_id] = results
+    return results_id
+
+
+def get_webapp_results(results_id: str) -> Optional[list[dict[str, Any]]]:
+    with _WEBAPP_RESULTS_LOCK:
+        return _WEBAPP_RESULTS.get(results_id)
@@ -1,11 +1,12 @@
 import asyncio
-import json
 
+import orjson
 from flask import Flask, jsonify, request, send_from_directory
 from telegram import Update
 
 from .config import settings
 from .logging import setup_logging
+from .utils import get_webapp_results
 
 
 logger = setup_logging()
@@ -33,16 +34,30 @@ def create_app(application, bot, loop) -> Flask:
     def serve_webapp():
         return send_from_directory('webapp', 'index.html')
 
+    @app.route('/results/<results_id>')
+    def webapp_results(results_id):
+        results = get_webapp_results(results_id)
+        if results is None:
+            return jsonify({"error": "results not found or expired"}), 404
+        return app.response_class(orjson.dumps(results), mimetype="application/json")
+
     @app.route('/<path:filename>')
     def serve_static(filename):
         return send_from_directory('webapp', filename)
 
     @app.route(settings.webhook_path, methods=['POST'])
     def webhook():
+        if settings.webhook_secret and request.headers.get("X-Telegram-Bot-Api-Secret-Token") != settings.webhook_secret:
+            logger.warning(
+                "Webhook request rejected: bad secret token",
+                extra={"service": settings.service_name, "env": settings.app_env},
+            )
+            return jsonify({"error": "forbidden"}), 403
+
         try:
-            payload = request.get_data(cache=False, as_text=True)
-            update = Update.de_json(json.loads(payload), bot)
-        except json.JSONDecodeError:
+            payload = request.get_data(cache=False)
+            update = Update.de_json(orjson.loads(payload), bot)
+        except orjson.JSONDecodeError:
             logger.error(
                 "Webhook payload was not valid JSON",
                 extra={"service": settings.service_name, "env": settings.app_env},
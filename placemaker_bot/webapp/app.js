@@ -116,13 +116,26 @@ function renderList(places) {
     });
 }
 
-window.onload = function() {
+async function fetchResults(resultsId) {
+    try {
+        const resp = await fetch(`/results/${encodeURIComponent(resultsId)}`);
+        return resp.ok ? await resp.json() : [];
+    } catch (e) {
+        return [];
+    }
+}
+
+window.onload = async function() {
+    const resultsId = getQueryParam('id');
     const dataParam = getQueryParam('data');
-    if (!dataParam) {
+    if (resultsId) {
+        allPlaces = await fetchResults(resultsId);
+    } else if (dataParam) {
+        allPlaces = decodeData(dataParam);
+    } else {
         renderList([]);
         return;
     }
-    allPlaces = decodeData(dataParam);
     filteredPlaces = [...allPlaces];
     setupFilters();
     renderList(filteredPlaces);